@@ -8,9 +8,12 @@ Provides:
 - Get unlinked transactions (for reconciliation)
 - Account lookup
 
+AsyncFireflyClient fetches the list endpoints concurrently with asyncio.
+
 Treats Firefly errors as loud failures with actionable messages.
 """
 
+from .async_client import AsyncFireflyClient
 from .client import (
     FireflyAPIError,
     FireflyCategory,
@@ -20,6 +23,7 @@ from .client import (
 )
 
 __all__ = [
+    "AsyncFireflyClient",
     "FireflyClient",
     "FireflyError",
     "FireflyAPIError",
@@ -0,0 +1,370 @@
+"""
+Async Firefly III API client for concurrent list fetches and imports.
+
+Covers the read-heavy list endpoints used during sync. Page 1 is fetched
+first to learn the page count, then the remaining pages are requested
+concurrently with asyncio.gather() over one pooled httpx.AsyncClient.
+It also covers the import path (external_id lookup, transaction and
+account creation) for pipelines that already run an event loop.
+Responses are parsed with the same helpers as FireflyClient, so both
+clients return identical objects.
+"""
+
+import asyncio
+import logging
+from typing import Any
+
+import httpx
+
+from ..schemas.firefly_payload import FireflyTransactionStore, validate_firefly_payload
+from .client import (
+    _STATIC_ENDPOINTS,
+    FireflyAPIError,
+    FireflyCategory,
+    FireflyConnectionError,
+    FireflyDuplicateError,
+    FireflyError,
+    FireflyTransaction,
+    _api_error,
+    _dumps,
+    _format_json,
+    _is_duplicate_error,
+    _match_external_id,
+    _parse_account,
+    _parse_category,
+    _parse_json_lazy,
+    _parse_transaction_page,
+    _search_term,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncFireflyClient:
+    """
+    Async client for Firefly III list endpoints.
+
+    Use as an async context manager so the connection pool is closed:
+
+        async with AsyncFireflyClient(url, token) as client:
+            transactions = await client.alist_transactions("2024-01-01", "2024-12-31")
+    """
+
+    DEFAULT_TIMEOUT = 30
+
+    def __init__(
+        self,
+        base_url: str,
+        token: str,
+        timeout: int = DEFAULT_TIMEOUT,
+        max_connections: int = 32,
+        http2: bool = False,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        """
+        Initialize async Firefly client.
+
+        Args:
+            base_url: Firefly III URL (e.g., "http://192.168.1.138:8081")
+            token: Personal access token
+            timeout: Request timeout in seconds
+            max_connections: Maximum concurrent connections (bounds page fan-out)
+            http2: Multiplex requests over HTTP/2 (needs the "h2" package)
+            transport: Optional httpx transport, e.g. for tests
+        """
+        self.base_url = base_url.rstrip("/")
+        self.token = token
+        self.timeout = timeout
+        self._urls = {endpoint: self.base_url + endpoint for endpoint in _STATIC_ENDPOINTS}
+
+        self._client = httpx.AsyncClient(
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Accept": "application/json",
+                "Content-Type": "application/json",
+            },
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=60,
+            ),
+            http2=http2,
+            transport=transport,
+        )
+        # Bounds in-flight page requests so queued ones don't hit the pool timeout
+        self._page_slots = asyncio.Semaphore(max_connections)
+
+        # Same dedup/name caches as FireflyClient, minus the TTLs: an async
+        # client is expected to live for one import run
+        self._negative_ext_id_cache: set[str] = set()
+        self._account_cache: dict[str, dict[str, int]] = {}
+
+    async def __aenter__(self) -> "AsyncFireflyClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self._client.aclose()
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict | None = None,
+        json_data: dict | None = None,
+    ) -> httpx.Response:
+        """Make an API request with the same error mapping as FireflyClient."""
+        url = self._urls.get(endpoint) or self.base_url + endpoint
+
+        logger.debug("API Request: %s %s", method, url)
+        if json_data and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Request body: %s", _format_json(json_data))
+
+        content = _dumps(json_data) if json_data is not None else None
+
+        try:
+            response = await self._client.request(method, url, params=params, content=content)
+        except httpx.TimeoutException as e:
+            logger.error("Timeout for %s: %s", url, e)
+            raise FireflyConnectionError(f"Request to Firefly timed out: {e}") from e
+        except httpx.ConnectError as e:
+            logger.error("Connection error to %s: %s", url, e)
+            raise FireflyConnectionError(
+                f"Failed to connect to Firefly at {self.base_url}: {e}"
+            ) from e
+        except httpx.HTTPError as e:
+            logger.error("Request error for %s: %s", url, e)
+            raise FireflyError(f"Request failed: {e}") from e
+
+        logger.debug("Response status: %s", response.status_code)
+
+        if response.is_error:
+            raise _api_error(response.status_code, response.reason_phrase, response.content)
+
+        return response
+
+    async def _paginate(self, endpoint: str, params: dict | None = None) -> list[Any]:
+        """
+        Fetch every page of a paginated endpoint, returning them in page order.
+
+        Page 1 is awaited first to read ``total_pages``; pages 2..N are then
+        requested concurrently, at most max_connections at a time.
+        """
+
+        async def fetch(page: int) -> Any:
+            page_params = dict(params) if params else {}
+            page_params["page"] = page
+            async with self._page_slots:
+                response = await self._request("GET", endpoint, params=page_params)
+            return _parse_json_lazy(response)
+
+        first = await fetch(1)
+        total_pages = first.get("meta", {}).get("pagination", {}).get("total_pages", 1)
+        rest = await asyncio.gather(*(fetch(page) for page in range(2, total_pages + 1)))
+        return [first, *rest]
+
+    async def alist_transactions(
+        self,
+        start_date: str,
+        end_date: str,
+        type_filter: str | None = None,
+    ) -> list[FireflyTransaction]:
+        """
+        List transactions in a date range.
+
+        Same results as FireflyClient.list_transactions(): one
+        FireflyTransaction per Firefly transaction, with splits aggregated.
+
+        Args:
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+            type_filter: Optional filter: withdrawal, deposit, transfer
+        """
+        params = {"start": start_date, "end": end_date}
+        if type_filter:
+            params["type"] = type_filter
+
+        pages = await self._paginate("/api/v1/transactions", params)
+        return [tx for data in pages for tx in _parse_transaction_page(data)]
+
+    async def alist_accounts(
+        self,
+        account_type: str = "asset",
+        include_identifiers: bool = False,
+    ) -> list[dict]:
+        """
+        List accounts of a specific type.
+
+        Args:
+            account_type: asset, expense, revenue, liability, cash
+            include_identifiers: If True, include IBAN, account_number, bic fields
+        """
+        pages = await self._paginate("/api/v1/accounts", {"type": account_type})
+        return [
+            _parse_account(account, include_identifiers)
+            for data in pages
+            for account in data.get("data", [])
+        ]
+
+    async def alist_categories(self) -> list[FireflyCategory]:
+        """List all categories from Firefly."""
+        pages = await self._paginate("/api/v1/categories")
+        return [_parse_category(item) for data in pages for item in data.get("data", [])]
+
+    async def afind_by_external_id(self, external_id: str) -> FireflyTransaction | None:
+        """Find a transaction by external_id, like FireflyClient.find_by_external_id()."""
+        if external_id in self._negative_ext_id_cache:
+            return None
+
+        try:
+            response = await self._request(
+                "GET",
+                "/api/v1/search/transactions",
+                params={"query": _search_term("external_id", external_id)},
+            )
+            found = _match_external_id(_parse_json_lazy(response), external_id)
+            if found is not None:
+                return found
+        except FireflyAPIError as e:
+            if e.status_code != 404:
+                raise
+
+        self._negative_ext_id_cache.add(external_id)
+        return None
+
+    async def acreate_transaction(
+        self,
+        payload: FireflyTransactionStore,
+        skip_duplicates: bool = True,
+    ) -> int | None:
+        """
+        Create a transaction, like FireflyClient.create_transaction().
+
+        Args:
+            payload: Transaction store payload
+            skip_duplicates: If True, don't raise error for duplicates
+
+        Returns:
+            Firefly transaction ID, or None if duplicate skipped
+        """
+        validation_errors = validate_firefly_payload(payload)
+        if validation_errors:
+            raise ValueError(f"Invalid payload: {'; '.join(validation_errors)}")
+
+        external_id = payload.transactions[0].external_id if payload.transactions else None
+        if external_id:
+            existing = await self.afind_by_external_id(external_id)
+            if existing is not None:
+                if skip_duplicates:
+                    logger.info(
+                        "Transaction with external_id '%s' already exists (id=%s)",
+                        external_id,
+                        existing.id,
+                    )
+                    return existing.id
+                raise FireflyDuplicateError(external_id, existing.id)
+
+        try:
+            response = await self._request(
+                "POST", "/api/v1/transactions", json_data=payload.to_dict()
+            )
+        except FireflyAPIError as e:
+            if _is_duplicate_error(e) and skip_duplicates:
+                logger.warning("Duplicate transaction detected by Firefly")
+                return None
+            raise
+
+        for split in payload.transactions:
+            if split.external_id:
+                self._negative_ext_id_cache.discard(split.external_id)
+
+        transaction_id = _parse_json_lazy(response).get("data", {}).get("id")
+        if transaction_id:
+            logger.info("Created Firefly transaction id=%s", transaction_id)
+        return int(transaction_id) if transaction_id else None
+
+    async def acreate_transactions_bulk(
+        self,
+        payloads: list[FireflyTransactionStore],
+        concurrency: int = 32,
+        skip_duplicates: bool = True,
+    ) -> list[int | None | Exception]:
+        """
+        Create many transactions concurrently.
+
+        Mirrors FireflyClient.create_transactions_bulk(): results are in
+        input order, failures are returned as exceptions, and payloads that
+        repeat an earlier external_id run after the first one completes.
+
+        Args:
+            payloads: Transaction payloads to create
+            concurrency: Maximum number of in-flight creates
+            skip_duplicates: Passed through to acreate_transaction()
+        """
+        slots = asyncio.Semaphore(concurrency)
+
+        async def create_one(index: int) -> int | None | Exception:
+            async with slots:
+                try:
+                    return await self.acreate_transaction(
+                        payloads[index], skip_duplicates=skip_duplicates
+                    )
+                except Exception as e:
+                    logger.warning("Failed to create transaction %d of batch: %s", index, e)
+                    return e
+
+        first: list[int] = []
+        repeats: list[int] = []
+        seen: set[str] = set()
+        for index, payload in enumerate(payloads):
+            external_id = payload.transactions[0].external_id if payload.transactions else None
+            if external_id and external_id in seen:
+                repeats.append(index)
+            else:
+                first.append(index)
+                if external_id:
+                    seen.add(external_id)
+
+        results: list[int | None | Exception] = [None] * len(payloads)
+        created = await asyncio.gather(*(create_one(index) for index in first))
+        for index, result in zip(first, created, strict=True):
+            results[index] = result
+        for index in repeats:
+            results[index] = await create_one(index)
+        return results
+
+    async def afind_or_create_account(
+        self,
+        name: str,
+        account_type: str = "expense",
+        currency_code: str = "EUR",
+    ) -> int:
+        """
+        Find an account by name or create it.
+
+        The account index for a type is loaded once per client; names are
+        compared casefolded, as in FireflyClient.find_or_create_account().
+        """
+        key = name.casefold()
+        index = self._account_cache.get(account_type)
+        if index is None:
+            index = {}
+            for account in await self.alist_accounts(account_type):
+                if account.get("name"):
+                    index.setdefault(account["name"].casefold(), int(account["id"]))
+            self._account_cache[account_type] = index
+        if key in index:
+            return index[key]
+
+        response = await self._request(
+            "POST",
+            "/api/v1/accounts",
+            json_data={"name": name, "type": account_type, "currency_code": currency_code},
+        )
+        account_id = int(_parse_json_lazy(response).get("data", {}).get("id", 0))
+        index[key] = account_id
+        return account_id
@@ -2,19 +2,151 @@
 Firefly III API client implementation.
 """
 
+import contextlib
+import contextvars
+import copy
+import functools
+import hashlib
+import inspect
 import json
 import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from decimal import Decimal
+from itertools import islice
+from pathlib import Path
+from typing import Any
 
+import httpx
 import requests
 from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
 from urllib3.util.retry import Retry
 
 from ..schemas.dedupe import generate_external_id_v2
 from ..schemas.firefly_payload import FireflyTransactionStore, validate_firefly_payload
 
+# orjson is an optional speedup (pip install ".[speedups]"); fall back to the
+# stdlib json module when it is not installed.
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# pysimdjson (also in ".[speedups]") parses large list pages lazily, so only
+# the fields the client actually reads are turned into Python objects.
+try:
+    import simdjson
+
+    HAS_SIMDJSON = True
+except ImportError:
+    HAS_SIMDJSON = False
+
 logger = logging.getLogger(__name__)
 
+# Retry(backoff_jitter=...) needs urllib3 >= 2.0; requests still allows 1.26.
+_RETRY_SUPPORTS_JITTER = "backoff_jitter" in inspect.signature(Retry).parameters
+
+# Transient statuses retried by the adapter. 500 is deliberately absent:
+# Firefly uses it for deterministic application errors.
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+_RETRY_METHODS = frozenset({"GET", "POST", "PUT", "DELETE"})
+
+# generate_external_id_v2 is pure; overlapping date windows and repeated
+# lookups of the same transaction recompute the same hash otherwise.
+_external_id_v2_cached = functools.lru_cache(maxsize=8192)(generate_external_id_v2)
+
+# Monotonic time by which the current logical operation must finish; set
+# with FireflyClient.deadline() and honoured by requests started in the same
+# thread or task (executor workers don't inherit it).
+_deadline: contextvars.ContextVar[float | None] = contextvars.ContextVar(
+    "firefly_deadline", default=None
+)
+
+# Bytes of an error response body kept on FireflyAPIError.response_body
+_ERROR_BODY_LIMIT = 4096
+
+# Search values made only of these characters need no quoting
+_PLAIN_SEARCH_VALUE_RE = re.compile(r"[A-Za-z0-9_.-]+")
+
+# Firefly reports a duplicate-hash rejection as a 422 field error whose
+# message mentions "duplicate".
+_DUPLICATE_RE = re.compile(r"duplicate", re.IGNORECASE)
+
+# Fixed API endpoints. FireflyClient resolves these to absolute URLs once at
+# construction time; per-ID endpoints are joined with the base URL per call.
+_STATIC_ENDPOINTS = (
+    "/api/v1/about",
+    "/api/v1/accounts",
+    "/api/v1/bills",
+    "/api/v1/budgets",
+    "/api/v1/categories",
+    "/api/v1/currencies",
+    "/api/v1/piggy-banks",
+    "/api/v1/recurrences",
+    "/api/v1/rule-groups",
+    "/api/v1/rules",
+    "/api/v1/search/accounts",
+    "/api/v1/search/transactions",
+    "/api/v1/tags",
+    "/api/v1/transactions",
+)
+
+
+def _parse_json(response: requests.Response) -> Any:
+    """Decode a JSON response body, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _parse_json_lazy(response: requests.Response) -> Any:
+    """
+    Decode a large list page, materializing values only when accessed.
+
+    With pysimdjson the result is a read-only document proxy supporting
+    .get(), indexing, len() and iteration; scalar leaves come back as plain
+    Python values. A fresh parser is used per response so proxies from
+    different pages (or threads) never share parser state. Without
+    pysimdjson this is the same as _parse_json().
+    """
+    if HAS_SIMDJSON:
+        return simdjson.Parser().parse(response.content)
+    return _parse_json(response)
+
+
+def _materialize(value: Any) -> Any:
+    """Convert a lazy simdjson container into plain Python lists/dicts."""
+    if HAS_SIMDJSON:
+        if isinstance(value, simdjson.Array):
+            return value.as_list()
+        if isinstance(value, simdjson.Object):
+            return value.as_dict()
+    return value
+
+
+def _dumps(data: Any) -> bytes:
+    """Encode a JSON request body, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+
+def _format_json(data: Any) -> str:
+    """Pretty-print a JSON payload for debug logging."""
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
 
 class FireflyError(Exception):
     """Base exception for Firefly client errors."""
@@ -36,18 +168,19 @@ class FireflyAPIError(FireflyError):
         self.message = message
         self.response_body = response_body
         self.errors = errors or {}
+        super().__init__(message)
 
-        # Build detailed error message
+    def __str__(self) -> str:
+        # Built on demand: lookups that catch and drop a 404 never format it
         error_details = []
-        if errors:
-            for field, msgs in errors.items():
-                if isinstance(msgs, list):
-                    error_details.extend([f"{field}: {m}" for m in msgs])
-                else:
-                    error_details.append(f"{field}: {msgs}")
+        for field, msgs in self.errors.items():
+            if isinstance(msgs, list):
+                error_details.extend([f"{field}: {m}" for m in msgs])
+            else:
+                error_details.append(f"{field}: {msgs}")
 
-        detail_str = "; ".join(error_details) if error_details else message
-        super().__init__(f"Firefly API error {status_code}: {detail_str}")
+        detail_str = "; ".join(error_details) if error_details else self.message
+        return f"Firefly API error {self.status_code}: {detail_str}"
 
 
 class FireflyConnectionError(FireflyError):
@@ -65,7 +198,7 @@ class FireflyDuplicateError(FireflyError):
         super().__init__(f"Transaction with external_id '{external_id}' already exists")
 
 
-@dataclass
+@dataclass(slots=True)
 class FireflyTransaction:
     """Firefly transaction representation.
 
@@ -77,7 +210,8 @@ class FireflyTransaction:
     - The category/description are from the first split (primary line)
 
     This ensures only one link per Firefly transaction is possible, regardless
-    of how many splits it contains.
+    of how many splits it contains. For single-split transactions,
+    transaction_journal_id lets updates address the split directly.
 
     External ID handling:
     - external_id: The actual external_id stored in Firefly (may be None)
@@ -101,6 +235,7 @@ class FireflyTransaction:
     tags: list[str] | None = None
     has_splits: bool = False
     split_count: int = 1
+    transaction_journal_id: int | None = None  # Journal ID of the split shown above
 
     @property
     def effective_external_id(self) -> str | None:
@@ -111,7 +246,7 @@ class FireflyTransaction:
         return self.external_id or self.computed_external_id
 
 
-@dataclass
+@dataclass(slots=True)
 class FireflyCategory:
     """Firefly category representation."""
 
@@ -149,6 +284,10 @@ def _normalize_tags(raw: object) -> list[str] | None:
             f"Unexpected tags format: expected list or None, got {type(raw).__name__}",
         )
 
+    # Fast path: the standard Firefly response is a plain list of strings
+    if all(type(item) is str for item in raw):
+        return [item for item in raw if item] or None
+
     result: list[str] = []
     _logged_unknown = False
 
@@ -177,6 +316,327 @@ def _normalize_tags(raw: object) -> list[str] | None:
     return result if result else None
 
 
+def _journal_id(split: Any) -> int | None:
+    """Return a split's transaction_journal_id as int, or None if absent."""
+    journal_id = split.get("transaction_journal_id")
+    return int(journal_id) if journal_id else None
+
+
+def _api_error(status_code: int, reason: str, content: bytes) -> FireflyAPIError:
+    """
+    Log and build a FireflyAPIError from an error response body.
+
+    Works on the raw bytes: the JSON is parsed once and the text is decoded
+    as UTF-8 directly, skipping the charset sniffing of response.text. Only
+    bodies that look like JSON are parsed, and the kept text is capped at
+    _ERROR_BODY_LIMIT bytes, so a proxy's multi-megabyte HTML error page
+    is neither parsed nor copied into the exception.
+    """
+    errors = {}
+    message = reason
+    if content[:64].lstrip()[:1] == b"{":
+        try:
+            error_json = orjson.loads(content) if HAS_ORJSON else json.loads(content)
+            errors = error_json.get("errors", {})
+            message = error_json.get("message", reason)
+        except Exception:
+            pass
+
+    logger.error("API Error %s: %s", status_code, message)
+    logger.error("Error details: %s", errors)
+    text = content[:_ERROR_BODY_LIMIT].decode("utf-8", "replace")
+    logger.debug("Response body (first %d bytes): %s", _ERROR_BODY_LIMIT, text)
+
+    return FireflyAPIError(
+        status_code=status_code,
+        message=message,
+        response_body=text,
+        errors=errors,
+    )
+
+
+def _search_term(field: str, value: str) -> str:
+    """
+    Build a ``field:value`` search term, quoting values Firefly would split.
+
+    External IDs contain colons (and may contain spaces or quotes), which
+    the search parser otherwise treats as separators, matching too much.
+    """
+    if _PLAIN_SEARCH_VALUE_RE.fullmatch(value):
+        return f"{field}:{value}"
+    escaped = value.replace('"', '\\"')
+    return f'{field}:"{escaped}"'
+
+
+def _is_duplicate_error(error: FireflyAPIError) -> bool:
+    """Return True if a 422 error is Firefly's duplicate transaction check."""
+    if error.status_code != 422:
+        return False
+    for msgs in error.errors.values():
+        for msg in msgs if isinstance(msgs, list) else (msgs,):
+            if _DUPLICATE_RE.search(str(msg)):
+                return True
+    return False
+
+
+def _match_external_id(data: Any, external_id: str) -> FireflyTransaction | None:
+    """Pick the split with exactly this external_id from a search result page."""
+    for result in data.get("data", []):
+        attrs = result.get("attributes", {})
+        transactions = attrs.get("transactions", [])
+
+        for tx in transactions:
+            if tx.get("external_id") != external_id:
+                continue
+            return FireflyTransaction(
+                id=int(result.get("id", 0)),
+                type=tx.get("type", ""),
+                date=tx.get("date", ""),
+                amount=tx.get("amount", ""),
+                description=tx.get("description", ""),
+                external_id=external_id,
+                source_name=tx.get("source_name"),
+                destination_name=tx.get("destination_name"),
+                internal_reference=tx.get("internal_reference"),
+                notes=tx.get("notes"),
+                has_splits=len(transactions) > 1,
+                split_count=len(transactions),
+                transaction_journal_id=_journal_id(tx),
+            )
+    return None
+
+
+def _parse_account(account: Any, include_identifiers: bool = False) -> dict:
+    """Build the account dict returned by list_accounts() from an API item."""
+    attrs = account.get("attributes", {})
+    account_dict = {
+        "id": account.get("id"),
+        "name": attrs.get("name"),
+        "type": attrs.get("type"),
+        "currency_code": attrs.get("currency_code"),
+    }
+    # Include bank identifiers for AI source account matching
+    if include_identifiers:
+        account_dict["iban"] = attrs.get("iban")
+        account_dict["account_number"] = attrs.get("account_number")
+        account_dict["bic"] = attrs.get("bic")
+    return account_dict
+
+
+def _parse_category(item: Any) -> FireflyCategory:
+    """Build a FireflyCategory from a category API item."""
+    attrs = item.get("attributes", {})
+    return FireflyCategory(
+        id=int(item.get("id", 0)),
+        name=attrs.get("name", ""),
+        notes=attrs.get("notes"),
+    )
+
+
+def _parse_transaction_page(data: Any) -> Iterator[FireflyTransaction]:
+    """Build one FireflyTransaction per transaction group on a list page."""
+    # Local aliases skip global lookups in the per-transaction loop
+    make_tx = FireflyTransaction
+    normalize_tags = _normalize_tags
+    materialize = _materialize
+    external_id_v2 = _external_id_v2_cached
+
+    for item in data.get("data", []):
+        tx_list = item.get("attributes", {}).get("transactions", [])
+
+        if not tx_list:
+            continue
+
+        # Aggregate all splits into a single transaction
+        # Use first split for primary metadata, sum amounts
+        first_split = tx_list[0]
+        fs_get = first_split.get
+        split_count = len(tx_list)
+        has_splits = split_count > 1
+
+        # Sum amounts from all splits exactly; Firefly sends decimal strings
+        total_amount = sum((Decimal(tx.get("amount") or 0) for tx in tx_list), Decimal(0))
+        # Keep the established short form ("11.48", "15.5") for amount strings
+        amount_str = str(float(total_amount))
+
+        # Collect all unique tags across splits, preserving first-seen order
+        all_tags: list[str] = []
+        seen_tags: set[str] = set()
+        for tx in tx_list:
+            for tag in normalize_tags(materialize(tx.get("tags"))) or ():
+                if tag not in seen_tags:
+                    seen_tags.add(tag)
+                    all_tags.append(tag)
+
+        # Keep original description primary; mark split groups in the notes
+        description = fs_get("description", "")
+        existing_notes = fs_get("notes") or ""
+        if has_splits:
+            combined_notes = f"{existing_notes} [Split: {split_count} parts]".strip()
+        else:
+            combined_notes = existing_notes or None
+
+        # Extract date in YYYY-MM-DD format for hash computation
+        date_full = fs_get("date", "")
+        tx_date = date_full[:10]
+        source_name = fs_get("source_name")
+        destination_name = fs_get("destination_name")
+
+        # Compute hash-based external_id for deduplication
+        # This is computed even if external_id exists, for consistent dedup
+        computed_external_id = None
+        try:
+            computed_external_id = external_id_v2(
+                amount=total_amount,
+                date=tx_date,
+                source=source_name,
+                destination=destination_name,
+                description=description,
+            )
+        except (ValueError, TypeError):
+            # If hash computation fails, continue without it
+            pass
+
+        # Positional in field order: this runs once per listed transaction
+        yield make_tx(
+            int(item.get("id", 0)),  # id
+            fs_get("type", ""),  # type
+            date_full,  # date
+            amount_str,  # amount
+            description,
+            fs_get("external_id"),
+            computed_external_id,
+            source_name,
+            destination_name,
+            fs_get("internal_reference"),
+            combined_notes,  # notes
+            fs_get("category_name"),
+            all_tags or None,  # tags
+            has_splits,
+            split_count,
+            _journal_id(first_split),
+        )
+
+
+class _CircuitBreaker:
+    """
+    Fail fast while Firefly is unreachable or erroring.
+
+    After ``failure_threshold`` consecutive connection errors or 5xx
+    responses the breaker opens and requests are rejected without being
+    sent. Once ``recovery_seconds`` have passed, a single probe request is
+    let through (half-open); its outcome closes or re-opens the breaker.
+    A threshold of 0 disables the breaker.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, recovery_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.recovery_seconds = recovery_seconds
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Return True if a request may be sent now."""
+        if self.failure_threshold <= 0:
+            return True
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if (
+                self.state == self.OPEN
+                and time.monotonic() - self._opened_at >= self.recovery_seconds
+            ):
+                self.state = self.HALF_OPEN
+                return True
+            return False
+
+    def on_success(self) -> None:
+        with self._lock:
+            self.state = self.CLOSED
+            self._failures = 0
+
+    def on_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.warning(
+                        "Firefly circuit opened after %d consecutive failures", self._failures
+                    )
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+
+class _RequestsTransport:
+    """Default transport: the client's pooled, retrying requests.Session."""
+
+    def __init__(self, session: requests.Session):
+        self.session = session
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        params: dict | None,
+        body: dict[str, Any],
+        timeout: float,
+    ) -> requests.Response:
+        return self.session.request(method=method, url=url, params=params, timeout=timeout, **body)
+
+
+class _HttpxTransport:
+    """
+    Transport over an httpx.Client, used for HTTP/2 multiplexing.
+
+    Concurrent requests (paginated fetches, bulk creates) share a single
+    connection instead of one per request. Responses and errors are mapped
+    to their requests equivalents so FireflyClient._request() handles both
+    transports the same way.
+    """
+
+    def __init__(self, client: httpx.Client):
+        self.client = client
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        params: dict | None,
+        body: dict[str, Any],
+        timeout: float,
+    ) -> requests.Response:
+        try:
+            if "data" in body:
+                result = self.client.request(
+                    method, url, params=params, content=body["data"], timeout=timeout
+                )
+            else:
+                result = self.client.request(
+                    method, url, params=params, json=body.get("json"), timeout=timeout
+                )
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(str(e)) from e
+        except (httpx.ConnectError, httpx.RemoteProtocolError) as e:
+            raise requests.exceptions.ConnectionError(str(e)) from e
+        except httpx.HTTPError as e:
+            raise requests.exceptions.RequestException(str(e)) from e
+
+        response = requests.Response()
+        response.status_code = result.status_code
+        response.reason = result.reason_phrase
+        response.headers = CaseInsensitiveDict(result.headers)
+        response.url = str(result.url)
+        response.encoding = result.encoding
+        response._content = result.content
+        return response
+
+
 class FireflyClient:
     """
     Client for Firefly III API.
@@ -190,6 +650,21 @@ class FireflyClient:
 
     DEFAULT_TIMEOUT = 30
 
+    # Maximum number of raw transaction groups kept by _get_full_transaction()
+    TRANSACTION_CACHE_SIZE = 256
+
+    # Maximum number of external_id -> transaction ID lookups remembered
+    EXTERNAL_ID_CACHE_SIZE = 4096
+
+    # Seconds the account/category name indexes are trusted before refetching
+    NAME_CACHE_TTL = 300
+
+    # Pages fetched in parallel by list_accounts/list_transactions/list_categories
+    PAGE_FETCH_WORKERS = 8
+
+    # Seconds list_accounts() results in cache_dir are reused across runs
+    ACCOUNTS_DISK_CACHE_TTL = 3600
+
     def __init__(
         self,
         base_url: str,
@@ -197,6 +672,12 @@ class FireflyClient:
         timeout: int = DEFAULT_TIMEOUT,
         max_retries: int = 3,
         backoff_factor: float = 0.5,
+        http2: bool = False,
+        backoff_jitter: float = 0.5,
+        pool_maxsize: int = 32,
+        breaker_threshold: int = 5,
+        breaker_recovery: float = 30,
+        cache_dir: Path | None = None,
     ):
         """
         Initialize Firefly client.
@@ -207,10 +688,25 @@ class FireflyClient:
             timeout: Request timeout in seconds
             max_retries: Maximum retry attempts
             backoff_factor: Backoff factor for retries
+            http2: Send requests over an HTTP/2 httpx client instead of
+                requests (needs the "h2" package: pip install ".[http2]")
+            backoff_jitter: Random extra seconds (0..jitter) added to each
+                backoff, so concurrent clients don't retry in lockstep
+            pool_maxsize: Connections kept open per host; raise it for
+                parallel imports with many worker threads
+            breaker_threshold: Consecutive connection errors/5xx responses
+                after which requests fail fast (0 disables the breaker)
+            breaker_recovery: Seconds before a failed-fast client probes
+                Firefly again
+            cache_dir: Directory for persisting list_accounts() results
+                between runs (disabled when None)
         """
         self.base_url = base_url.rstrip("/")
         self.token = token
         self.timeout = timeout
+        self._urls = {endpoint: self.base_url + endpoint for endpoint in _STATIC_ENDPOINTS}
+        # Default deadline for create_transaction(): every attempt timing out
+        self._operation_timeout = timeout * (max_retries + 1)
 
         # Configure session with retry
         self.session = requests.Session()
@@ -219,19 +715,87 @@ class FireflyClient:
                 "Authorization": f"Bearer {token}",
                 "Accept": "application/json",
                 "Content-Type": "application/json",
+                "Connection": "keep-alive",
             }
         )
 
+        # Retry transient failures inside the adapter so paginated loops do
+        # not have to restart from page 1. With raise_on_status=False the
+        # final response is returned once retries are exhausted, so it
+        # surfaces as a FireflyAPIError with its status. Retry-After from a
+        # 429/503 takes precedence over the backoff. The single adapter (and
+        # its Retry) serves both http:// and https://.
+        jitter = {"backoff_jitter": backoff_jitter} if _RETRY_SUPPORTS_JITTER else {}
         retry_strategy = Retry(
             total=max_retries,
             backoff_factor=backoff_factor,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "POST", "PUT", "DELETE"],
+            status_forcelist=_RETRY_STATUSES,
+            allowed_methods=_RETRY_METHODS,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+            **jitter,
+        )
+        # Size the pool for concurrent page fetches and clients shared across
+        # worker threads, so connections are reused instead of re-handshaking.
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=16,
+            pool_maxsize=pool_maxsize,
+            pool_block=False,
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
+        # HTTP/2 multiplexes concurrent requests over one connection. httpx
+        # only retries failed connects, not 429/5xx responses.
+        self._transport: _RequestsTransport | _HttpxTransport
+        if http2:
+            self._transport = _HttpxTransport(
+                httpx.Client(
+                    http2=True,
+                    headers=dict(self.session.headers),
+                    limits=httpx.Limits(max_keepalive_connections=16, max_connections=pool_maxsize),
+                    transport=httpx.HTTPTransport(http2=True, retries=max_retries),
+                )
+            )
+        else:
+            self._transport = _RequestsTransport(self.session)
+
+        # On-disk list_accounts() cache, namespaced by instance and token so
+        # users with different tokens never see each other's accounts
+        self._cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._disk_cache_key = hashlib.sha256(f"{self.base_url}\n{token}".encode()).hexdigest()[:16]
+
+        # Shared by all threads using this client; 4xx responses don't count
+        self._breaker = _CircuitBreaker(breaker_threshold, breaker_recovery)
+
+        # LRU cache of raw transaction groups, keyed by transaction ID.
+        # Shared by update_transaction_linkage() and set_external_id() and
+        # invalidated after every PUT to that transaction.
+        self._tx_cache: OrderedDict[int, dict] = OrderedDict()
+
+        # External IDs that find_by_external_id() found no transaction for.
+        # Entries are dropped when this client writes that external_id; call
+        # clear_dedup_cache() between sync runs to pick up outside changes.
+        self._negative_ext_id_cache: set[str] = set()
+
+        # LRU of external_id -> Firefly ID for lookups that found a
+        # transaction and for transactions this client wrote, so reruns and
+        # retries skip the search. Cleared by clear_dedup_cache() as well.
+        self._ext_id_hits: OrderedDict[str, int] = OrderedDict()
+
+        # external_id -> Firefly ID for a date window, filled by
+        # prefetch_external_ids() so create_transaction() can skip searches.
+        self._known_ext_ids: dict[str, int] | None = None
+        self._known_ext_ids_window: tuple[str, str] | None = None
+
+        # Casefolded name -> ID indexes used by find_or_create_account() and
+        # find_category_by_name(), refreshed after NAME_CACHE_TTL seconds.
+        self._account_cache: dict[str, dict[str, int]] = {}
+        self._account_cache_ts: dict[str, float] = {}
+        self._category_cache: dict[str, FireflyCategory] = {}
+        self._category_cache_ts: float | None = None
+
     def _request(
         self,
         method: str,
@@ -240,58 +804,273 @@ class FireflyClient:
         json_data: dict | None = None,
     ) -> requests.Response:
         """Make an API request with error handling."""
-        url = f"{self.base_url}{endpoint}"
+        url = self._urls.get(endpoint) or self.base_url + endpoint
 
-        logger.debug(f"API Request: {method} {url}")
-        if json_data:
-            logger.debug(f"Request body: {json.dumps(json_data, indent=2)}")
+        logger.debug("API Request: %s %s", method, url)
+        if json_data and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Request body: %s", _format_json(json_data))
 
-        try:
-            response = self.session.request(
-                method=method,
-                url=url,
-                params=params,
-                json=json_data,
-                timeout=self.timeout,
+        if HAS_ORJSON and json_data is not None:
+            # Pre-serialize with orjson; Content-Type is set on the session
+            body: dict[str, Any] = {"data": orjson.dumps(json_data)}
+        else:
+            body = {"json": json_data}
+
+        timeout = self.timeout
+        deadline = _deadline.get()
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise FireflyConnectionError(f"Deadline exceeded before {method} {url}")
+            timeout = min(timeout, remaining)
+
+        if not self._breaker.allow():
+            raise FireflyConnectionError(
+                f"Firefly at {self.base_url} is failing; circuit open, not sending {method} {url}"
             )
+
+        try:
+            response = self._transport.send(method, url, params, body, timeout)
         except requests.exceptions.ConnectionError as e:
-            logger.error(f"Connection error to {url}: {e}")
+            self._breaker.on_failure()
+            logger.error("Connection error to %s: %s", url, e)
             raise FireflyConnectionError(
                 f"Failed to connect to Firefly at {self.base_url}: {e}"
             ) from e
         except requests.exceptions.Timeout as e:
-            logger.error(f"Timeout for {url}: {e}")
+            self._breaker.on_failure()
+            logger.error("Timeout for %s: %s", url, e)
             raise FireflyConnectionError(f"Request to Firefly timed out: {e}") from e
         except requests.exceptions.RequestException as e:
-            logger.error(f"Request error for {url}: {e}")
+            self._breaker.on_failure()
+            logger.error("Request error for %s: %s", url, e)
             raise FireflyError(f"Request failed: {e}") from e
 
-        logger.debug(f"Response status: {response.status_code}")
+        logger.debug("Response status: %s", response.status_code)
+
+        if response.status_code >= 500:
+            self._breaker.on_failure()
+        else:
+            self._breaker.on_success()
 
         if not response.ok:
-            error_body = None
-            errors = {}
+            raise _api_error(response.status_code, response.reason, response.content)
 
-            try:
-                error_body = response.text
-                error_json = response.json()
-                errors = error_json.get("errors", {})
-                message = error_json.get("message", response.reason)
-            except Exception:
-                message = response.reason
-
-            logger.error(f"API Error {response.status_code}: {message}")
-            logger.error(f"Error details: {errors}")
-            logger.debug(f"Full response body: {error_body}")
-
-            raise FireflyAPIError(
-                status_code=response.status_code,
-                message=message,
-                response_body=error_body,
-                errors=errors,
+        return response
+
+    @contextlib.contextmanager
+    def deadline(self, seconds: float) -> Iterator[None]:
+        """
+        Cap requests made inside the block at the time left of ``seconds``.
+
+        The cap applies per attempt, in this thread: each request's timeout
+        is limited to the time remaining when it starts, and requests started
+        after the deadline fail with FireflyConnectionError. urllib3 retries
+        of a request are not cut short, so one request with retries can
+        overrun the deadline. Nested deadlines can only shorten the outer
+        one. The deadline is a contextvar, so it is not seen by requests made
+        from executor threads (_paginate, _prefetch_transactions,
+        create_many workers).
+        """
+        current = _deadline.get()
+        deadline = time.monotonic() + seconds
+        if current is not None:
+            deadline = min(deadline, current)
+        token = _deadline.set(deadline)
+        try:
+            yield
+        finally:
+            _deadline.reset(token)
+
+    def _paginate(
+        self,
+        endpoint: str,
+        params: dict | None = None,
+        parse: Callable[[requests.Response], Any] = _parse_json,
+        max_workers: int = 1,
+        max_pages: int | None = None,
+    ) -> Iterator[Any]:
+        """
+        Yield the decoded JSON body of each page of a paginated endpoint.
+
+        Page 1 is always fetched first to learn ``total_pages``. With the
+        default ``max_workers=1`` the remaining pages are fetched lazily, so
+        callers that stop iterating early never request them. With
+        ``max_workers > 1`` they are fetched concurrently over the shared
+        session and yielded in page order.
+
+        Args:
+            endpoint: API endpoint path (e.g., "/api/v1/bills")
+            params: Extra query parameters sent with every page request
+            parse: Decoder applied to each page response
+            max_workers: Number of pages fetched in parallel after page 1
+            max_pages: Optional cap on the number of pages fetched
+        """
+
+        def fetch(page: int) -> requests.Response:
+            page_params = dict(params) if params else {}
+            page_params["page"] = page
+            return self._request("GET", endpoint, params=page_params)
+
+        data = parse(fetch(1))
+        yield data
+
+        total_pages = data.get("meta", {}).get("pagination", {}).get("total_pages", 1)
+        last_page = total_pages
+        if max_pages is not None and total_pages > max_pages:
+            logger.warning(
+                "Reached max_pages limit (%d) while fetching %s. Total pages: %d.",
+                max_pages,
+                endpoint,
+                total_pages,
             )
+            last_page = max_pages
 
-        return response
+        remaining = range(2, last_page + 1)
+        if not remaining:
+            return
+
+        if max_workers <= 1:
+            for page in remaining:
+                yield parse(fetch(page))
+            return
+
+        # Responses are fetched in worker threads but decoded here, in page order
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(remaining))) as executor:
+            for response in executor.map(fetch, remaining):
+                yield parse(response)
+
+    def _get_full_transaction(self, transaction_id: int) -> dict:
+        """
+        Get the raw transaction group data for a transaction ID.
+
+        Consults the LRU transaction cache first and only issues a GET on a
+        miss. The returned dict is a copy, so callers may mutate it freely.
+
+        Args:
+            transaction_id: Firefly transaction ID
+
+        Returns:
+            The "data" object of GET /api/v1/transactions/{id}
+        """
+        data = self._tx_cache.get(transaction_id)
+        if data is None:
+            response = self._request("GET", f"/api/v1/transactions/{transaction_id}")
+            data = _parse_json(response).get("data", {})
+            self._cache_transaction(transaction_id, data)
+        else:
+            self._tx_cache.move_to_end(transaction_id)
+
+        return copy.deepcopy(data)
+
+    def _cache_transaction(self, transaction_id: int, data: dict) -> None:
+        """Store raw transaction group data in the LRU cache."""
+        self._tx_cache[transaction_id] = data
+        self._tx_cache.move_to_end(transaction_id)
+        while len(self._tx_cache) > self.TRANSACTION_CACHE_SIZE:
+            self._tx_cache.popitem(last=False)
+
+    def _invalidate_transaction(self, transaction_id: int) -> None:
+        """Drop a transaction from the LRU cache after it was modified."""
+        self._tx_cache.pop(transaction_id, None)
+
+    def _forget_missing_external_ids(self, splits: list) -> None:
+        """Drop external IDs of written splits from the negative lookup cache."""
+        for split in splits:
+            if split.external_id:
+                self._negative_ext_id_cache.discard(split.external_id)
+
+    def _remember_external_id(self, external_id: str, transaction_id: int) -> None:
+        """Record the transaction an external_id belongs to in the LRU."""
+        self._negative_ext_id_cache.discard(external_id)
+        self._ext_id_hits[external_id] = transaction_id
+        self._ext_id_hits.move_to_end(external_id)
+        while len(self._ext_id_hits) > self.EXTERNAL_ID_CACHE_SIZE:
+            self._ext_id_hits.popitem(last=False)
+
+    def _forget_external_ids_of(self, transaction_id: int) -> None:
+        """Drop remembered external_ids of a transaction before rewriting them."""
+        stale = [ext_id for ext_id, tid in self._ext_id_hits.items() if tid == transaction_id]
+        for ext_id in stale:
+            del self._ext_id_hits[ext_id]
+
+    def clear_dedup_cache(self) -> None:
+        """Forget cached external ID lookups, including prefetched ones."""
+        self._negative_ext_id_cache.clear()
+        self._ext_id_hits.clear()
+        self._known_ext_ids = None
+        self._known_ext_ids_window = None
+
+    def prefetch_external_ids(self, start_date: str, end_date: str) -> dict[str, int]:
+        """
+        Load the external IDs of all transactions in a date range.
+
+        Call once before a bulk import: create_transaction() then resolves
+        duplicates for payloads dated inside the window from this map instead
+        of one search request per transaction.
+
+        Args:
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+
+        Returns:
+            Mapping of external_id to Firefly transaction ID
+        """
+        self._known_ext_ids = {
+            tx.external_id: tx.id
+            for tx in self.list_transactions(start_date, end_date)
+            if tx.external_id
+        }
+        self._known_ext_ids_window = (start_date, end_date)
+        return self._known_ext_ids
+
+    def _lookup_external_id(self, external_id: str, date: str) -> int | None:
+        """
+        Get the Firefly ID of the transaction with this external_id, if any.
+
+        Uses the prefetched map for dates inside the prefetched window, then
+        remembered lookups, and falls back to find_by_external_id() otherwise.
+        """
+        window = self._known_ext_ids_window
+        if self._known_ext_ids is not None and window and window[0] <= date[:10] <= window[1]:
+            return self._known_ext_ids.get(external_id)
+        transaction_id = self._ext_id_hits.get(external_id)
+        if transaction_id is not None:
+            self._ext_id_hits.move_to_end(external_id)
+            return transaction_id
+        existing = self.find_by_external_id(external_id)
+        return existing.id if existing else None
+
+    def _prefetch_transactions(self, transaction_ids: list[int], max_workers: int = 8) -> None:
+        """
+        Warm the transaction cache for a batch of IDs with concurrent GETs.
+
+        Intended for loops that call update_transaction_linkage() or
+        set_external_id() for many transactions. IDs that are already cached
+        are skipped; failed fetches are left for the regular call to report.
+
+        Args:
+            transaction_ids: Firefly transaction IDs to fetch
+            max_workers: Maximum number of concurrent requests
+        """
+        missing = [tid for tid in dict.fromkeys(transaction_ids) if tid not in self._tx_cache]
+        if not missing:
+            return
+
+        def fetch(transaction_id: int) -> dict | None:
+            try:
+                response = self._request("GET", f"/api/v1/transactions/{transaction_id}")
+            except FireflyError as e:
+                logger.debug("Prefetch of transaction %s failed: %s", transaction_id, e)
+                return None
+            return _parse_json(response).get("data", {})
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(fetch, missing))
+
+        for transaction_id, data in zip(missing, results, strict=True):
+            if data is not None:
+                self._cache_transaction(transaction_id, data)
 
     def test_connection(self) -> bool:
         """Test connection to Firefly API."""
@@ -304,12 +1083,14 @@ class FireflyClient:
     def get_about(self) -> dict:
         """Get Firefly III instance information."""
         response = self._request("GET", "/api/v1/about")
-        return response.json().get("data", {})
+        return _parse_json(response).get("data", {})
 
     def create_transaction(
         self,
         payload: FireflyTransactionStore,
         skip_duplicates: bool = True,
+        existing: dict[str, FireflyTransaction] | None = None,
+        skip_duplicate_check: bool = False,
     ) -> int | None:
         """
         Create a transaction in Firefly III.
@@ -317,6 +1098,13 @@ class FireflyClient:
         Args:
             payload: Transaction store payload
             skip_duplicates: If True, don't raise error for duplicates
+            existing: Result of find_by_external_ids() for the batch; when
+                given, the duplicate check uses it instead of searching
+            skip_duplicate_check: POST straight away, without the
+                external_id lookup, with Firefly's duplicate-hash check
+                enabled instead. Only when Firefly rejects the transaction
+                as a duplicate is the existing one looked up by external_id.
+                Saves the search request for new transactions.
 
         Returns:
             Firefly transaction ID, or None if duplicate skipped
@@ -331,45 +1119,152 @@ class FireflyClient:
         if validation_errors:
             raise ValueError(f"Invalid payload: {'; '.join(validation_errors)}")
 
-        # Check for existing transaction with same external_id
-        if payload.transactions:
-            external_id = payload.transactions[0].external_id
-            if external_id:
-                existing = self.find_by_external_id(external_id)
-                if existing:
-                    if skip_duplicates:
-                        logger.info(
-                            f"Transaction with external_id '{external_id}' already exists (id={existing.id})"
-                        )
-                        return existing.id
+        # The lookup and the POST each start within one deadline (per attempt)
+        with self.deadline(self._operation_timeout):
+            # Check for existing transaction with same external_id
+            if payload.transactions and not skip_duplicate_check:
+                external_id = payload.transactions[0].external_id
+                if external_id:
+                    if existing is not None:
+                        match = existing.get(external_id)
+                        existing_id = match.id if match else None
                     else:
-                        raise FireflyDuplicateError(external_id, existing.id)
-
-        # Create transaction
-        try:
-            response = self._request(
-                "POST",
-                "/api/v1/transactions",
-                json_data=payload.to_dict(),
-            )
-        except FireflyAPIError as e:
-            # Check if it's a duplicate hash error
-            if e.status_code == 422 and "duplicate" in str(e.errors).lower():
-                if skip_duplicates:
-                    logger.warning("Duplicate transaction detected by Firefly")
-                    return None
+                        existing_id = self._lookup_external_id(
+                            external_id, payload.transactions[0].date
+                        )
+                    if existing_id is not None:
+                        if skip_duplicates:
+                            logger.info(
+                                f"Transaction with external_id '{external_id}' already exists (id={existing_id})"
+                            )
+                            return existing_id
+                        else:
+                            raise FireflyDuplicateError(external_id, existing_id)
+
+            body = payload.to_dict()
+            if skip_duplicate_check:
+                # Firefly's hash check stands in for the skipped search
+                body["error_if_duplicate_hash"] = True
+
+            # Create transaction
+            try:
+                response = self._request("POST", "/api/v1/transactions", json_data=body)
+            except FireflyAPIError as e:
+                # Check if it's a duplicate hash error
+                if _is_duplicate_error(e):
+                    if skip_duplicate_check:
+                        existing_id = self._recover_duplicate_id(payload)
+                        if existing_id is not None:
+                            if skip_duplicates:
+                                return existing_id
+                            raise FireflyDuplicateError(
+                                payload.transactions[0].external_id, existing_id
+                            ) from e
+                    if skip_duplicates:
+                        logger.warning("Duplicate transaction detected by Firefly")
+                        return None
+                    raise
                 raise
-            raise
+
+        self._forget_missing_external_ids(payload.transactions)
 
         # Extract transaction ID from response
-        data = response.json()
+        data = _parse_json(response)
         transaction_id = data.get("data", {}).get("id")
 
         if transaction_id:
             logger.info(f"Created Firefly transaction id={transaction_id}")
+            for split in payload.transactions:
+                if split.external_id:
+                    self._remember_external_id(split.external_id, int(transaction_id))
+                    if self._known_ext_ids is not None:
+                        self._known_ext_ids[split.external_id] = int(transaction_id)
 
         return int(transaction_id) if transaction_id else None
 
+    def _recover_duplicate_id(self, payload: FireflyTransactionStore) -> int | None:
+        """Find the transaction Firefly reported the payload as a duplicate of."""
+        external_id = payload.transactions[0].external_id if payload.transactions else None
+        if not external_id:
+            return None
+        # Firefly just said it exists, so a cached miss is stale
+        self._negative_ext_id_cache.discard(external_id)
+        found = self.find_by_external_id(external_id)
+        if found is None:
+            return None
+        logger.info(
+            "Transaction with external_id '%s' already exists (id=%s)", external_id, found.id
+        )
+        return found.id
+
+    def create_transactions_bulk(
+        self,
+        payloads: list[FireflyTransactionStore],
+        max_concurrency: int = 8,
+        skip_duplicates: bool = True,
+    ) -> list[int | None | Exception]:
+        """
+        Create many transactions concurrently.
+
+        External IDs for the batch's date span are prefetched once (unless an
+        earlier prefetch_external_ids() already covers it), so duplicate
+        checks need no per-transaction search. POSTs are then dispatched over
+        the shared, connection-pooled session. Payloads repeating an external_id
+        seen earlier in the batch are created after the first one finishes,
+        so they resolve as duplicates instead of racing it.
+
+        Args:
+            payloads: Transaction payloads to create
+            max_concurrency: Maximum number of concurrent requests
+            skip_duplicates: Passed through to create_transaction()
+
+        Returns:
+            One entry per payload, in input order: the Firefly transaction ID
+            (None if a duplicate was skipped without an ID), or the exception
+            raised while creating it.
+        """
+        if not payloads:
+            return []
+
+        dates = [p.transactions[0].date[:10] for p in payloads if p.transactions]
+        if dates:
+            start_date, end_date = min(dates), max(dates)
+            window = self._known_ext_ids_window
+            if not (
+                self._known_ext_ids is not None
+                and window
+                and window[0] <= start_date
+                and end_date <= window[1]
+            ):
+                self.prefetch_external_ids(start_date, end_date)
+
+        def create_one(index: int) -> int | None | Exception:
+            try:
+                return self.create_transaction(payloads[index], skip_duplicates=skip_duplicates)
+            except Exception as e:
+                logger.warning("Failed to create transaction %d of batch: %s", index, e)
+                return e
+
+        first: list[int] = []
+        repeats: list[int] = []
+        seen: set[str] = set()
+        for index, payload in enumerate(payloads):
+            external_id = payload.transactions[0].external_id if payload.transactions else None
+            if external_id and external_id in seen:
+                repeats.append(index)
+            else:
+                first.append(index)
+                if external_id:
+                    seen.add(external_id)
+
+        results: list[int | None | Exception] = [None] * len(payloads)
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            for index, result in zip(first, executor.map(create_one, first), strict=True):
+                results[index] = result
+        for index in repeats:
+            results[index] = create_one(index)
+        return results
+
     def update_transaction(
         self,
         transaction_id: int,
@@ -399,6 +1294,12 @@ class FireflyClient:
             f"/api/v1/transactions/{transaction_id}",
             json_data=payload.to_dict(),
         )
+        self._invalidate_transaction(transaction_id)
+        self._forget_missing_external_ids(payload.transactions)
+        self._forget_external_ids_of(transaction_id)
+        for split in payload.transactions:
+            if split.external_id:
+                self._remember_external_id(split.external_id, transaction_id)
 
         logger.info(f"Updated Firefly transaction id={transaction_id}")
         return True
@@ -409,45 +1310,74 @@ class FireflyClient:
 
         Note: Firefly III doesn't have direct external_id search,
         so we search by the external_id value in the query.
+
+        Misses are remembered until this client writes that external_id or
+        clear_dedup_cache() is called, so repeated lookups skip the search.
         """
+        if external_id in self._negative_ext_id_cache:
+            return None
+
         try:
             # Search transactions with the external_id
             response = self._request(
                 "GET",
                 "/api/v1/search/transactions",
-                params={"query": f"external_id:{external_id}"},
+                params={"query": _search_term("external_id", external_id)},
             )
 
-            results = response.json().get("data", [])
-
-            for result in results:
-                attrs = result.get("attributes", {})
-                transactions = attrs.get("transactions", [])
-
-                for tx in transactions:
-                    if tx.get("external_id") == external_id:
-                        return FireflyTransaction(
-                            id=int(result.get("id", 0)),
-                            type=tx.get("type", ""),
-                            date=tx.get("date", ""),
-                            amount=tx.get("amount", ""),
-                            description=tx.get("description", ""),
-                            external_id=tx.get("external_id"),
-                            source_name=tx.get("source_name"),
-                            destination_name=tx.get("destination_name"),
-                        )
+            found = _match_external_id(_parse_json_lazy(response), external_id)
+            if found is not None:
+                self._remember_external_id(external_id, found.id)
+                return found
         except FireflyAPIError as e:
-            if e.status_code == 404:
-                return None
-            raise
+            if e.status_code != 404:
+                raise
 
+        self._negative_ext_id_cache.add(external_id)
         return None
 
+    def find_by_external_ids(
+        self,
+        external_ids: list[str],
+        max_workers: int = PAGE_FETCH_WORKERS,
+    ) -> dict[str, FireflyTransaction]:
+        """
+        Find transactions for many external_ids at once.
+
+        Firefly combines search terms with AND, so the IDs cannot share one
+        query; the per-ID searches are run concurrently instead. Misses land
+        in the negative cache like find_by_external_id() misses.
+
+        Args:
+            external_ids: External IDs to look up (duplicates are searched once)
+            max_workers: Maximum number of concurrent searches
+
+        Returns:
+            Mapping of external_id to transaction, for the IDs that exist
+        """
+        unique_ids = [ext_id for ext_id in dict.fromkeys(external_ids) if ext_id]
+        if not unique_ids:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(self.find_by_external_id, unique_ids))
+
+        return {
+            ext_id: tx for ext_id, tx in zip(unique_ids, results, strict=True) if tx is not None
+        }
+
     def get_transaction(self, transaction_id: int) -> FireflyTransaction | None:
-        """Get a transaction by ID."""
+        """
+        Get a transaction by ID.
+
+        Always fetches from the API, and stores the group in the transaction
+        cache so a following update_transaction_linkage() or
+        set_external_id() for the same ID does not fetch it again.
+        """
         try:
             response = self._request("GET", f"/api/v1/transactions/{transaction_id}")
-            data = response.json().get("data", {})
+            data = _parse_json(response).get("data", {})
+            self._cache_transaction(transaction_id, data)
             attrs = data.get("attributes", {})
             transactions = attrs.get("transactions", [])
 
@@ -462,7 +1392,7 @@ class FireflyClient:
                 # Compute hash-based external_id for deduplication
                 computed_external_id = None
                 try:
-                    computed_external_id = generate_external_id_v2(
+                    computed_external_id = _external_id_v2_cached(
                         amount=amount,
                         date=tx_date,
                         source=source_name,
@@ -482,6 +1412,11 @@ class FireflyClient:
                     computed_external_id=computed_external_id,
                     source_name=source_name,
                     destination_name=destination_name,
+                    internal_reference=tx.get("internal_reference"),
+                    notes=tx.get("notes"),
+                    has_splits=len(transactions) > 1,
+                    split_count=len(transactions),
+                    transaction_journal_id=_journal_id(tx),
                 )
         except FireflyAPIError as e:
             if e.status_code == 404:
@@ -508,49 +1443,77 @@ class FireflyClient:
             List of account dictionaries with id, name, type, currency_code,
             and optionally iban, account_number, bic if include_identifiers=True
         """
+        cache_path = self._accounts_cache_path(account_type, max_pages, include_identifiers)
+        if cache_path is not None:
+            cached = self._read_accounts_cache(cache_path)
+            if cached is not None:
+                return cached
+
+        accounts = self._fetch_accounts(account_type, max_pages, include_identifiers)
+
+        if cache_path is not None:
+            self._write_accounts_cache(cache_path, accounts)
+        return accounts
+
+    def _fetch_accounts(
+        self, account_type: str, max_pages: int, include_identifiers: bool
+    ) -> list[dict]:
+        """List accounts from the API, bypassing the on-disk cache."""
         accounts = []
-        page = 1
 
-        while True:
-            response = self._request(
-                "GET",
-                "/api/v1/accounts",
-                params={"type": account_type, "page": page},
+        for data in self._paginate(
+            "/api/v1/accounts",
+            params={"type": account_type},
+            parse=_parse_json_lazy,
+            max_workers=self.PAGE_FETCH_WORKERS,
+            max_pages=max_pages,
+        ):
+            accounts.extend(
+                _parse_account(account, include_identifiers) for account in data.get("data", [])
             )
+        return accounts
 
-            data = response.json()
-            for account in data.get("data", []):
-                attrs = account.get("attributes", {})
-                account_dict = {
-                    "id": account.get("id"),
-                    "name": attrs.get("name"),
-                    "type": attrs.get("type"),
-                    "currency_code": attrs.get("currency_code"),
-                }
-                # Include bank identifiers for AI source account matching
-                if include_identifiers:
-                    account_dict["iban"] = attrs.get("iban")
-                    account_dict["account_number"] = attrs.get("account_number")
-                    account_dict["bic"] = attrs.get("bic")
-                accounts.append(account_dict)
+    def _accounts_cache_path(
+        self, account_type: str, max_pages: int, include_identifiers: bool
+    ) -> Path | None:
+        """Return the cache file for a list_accounts() call, or None if disabled.
 
-            # Check for more pages
-            meta = data.get("meta", {}).get("pagination", {})
-            total_pages = meta.get("total_pages", 1)
+        max_pages is part of the key so a truncated listing is never served
+        to a call that asked for more pages.
+        """
+        if self._cache_dir is None:
+            return None
+        suffix = "_ids" if include_identifiers else ""
+        name = f"accounts_{self._disk_cache_key}_{account_type}_p{max_pages}{suffix}.json"
+        return self._cache_dir / name
 
-            if page >= total_pages or page >= max_pages:
-                if page >= max_pages and total_pages > max_pages:
-                    logger.warning(
-                        "Reached max_pages limit (%d) while fetching %s accounts. "
-                        "Total pages: %d. Some accounts may not be listed.",
-                        max_pages,
-                        account_type,
-                        total_pages,
-                    )
-                break
-            page += 1
+    def _read_accounts_cache(self, path: Path) -> list[dict] | None:
+        """Load cached accounts if the file exists and is within the TTL."""
+        try:
+            if time.time() - path.stat().st_mtime >= self.ACCOUNTS_DISK_CACHE_TTL:
+                return None
+            return json.loads(path.read_bytes())
+        except (OSError, ValueError):
+            return None
 
-        return accounts
+    def _write_accounts_cache(self, path: Path, accounts: list[dict]) -> None:
+        """Write accounts atomically; a failed write only costs the cache."""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(_dumps(accounts))
+            os.replace(tmp_name, path)
+        except OSError as e:
+            logger.debug("Could not write accounts cache %s: %s", path, e)
+
+    def _drop_accounts_disk_cache(self, account_type: str | None = None) -> None:
+        """Delete cached list_accounts() files for one account type or all."""
+        if self._cache_dir is None:
+            return
+        pattern = f"accounts_{self._disk_cache_key}_{account_type or '*'}*.json"
+        for path in self._cache_dir.glob(pattern):
+            path.unlink(missing_ok=True)
 
     def get_account(self, account_id: int) -> dict | None:
         """
@@ -564,7 +1527,7 @@ class FireflyClient:
         """
         try:
             response = self._request("GET", f"/api/v1/accounts/{account_id}")
-            data = response.json()
+            data = _parse_json(response)
             account_data = data.get("data", {})
             attrs = account_data.get("attributes", {})
             return {
@@ -594,11 +1557,24 @@ class FireflyClient:
         Returns:
             Account ID
         """
-        # Search existing accounts
-        accounts = self.list_accounts(account_type)
-        for account in accounts:
-            if account["name"].lower() == name.lower():
-                return int(account["id"])
+        key = name.casefold()
+        cached_at = self._account_cache_ts.get(account_type)
+        if cached_at is not None and time.monotonic() - cached_at < self.NAME_CACHE_TTL:
+            index = self._account_cache[account_type]
+            account_id = index.get(key)
+            if account_id is not None:
+                return account_id
+            # Fresh index but unknown name: ask the server for just this name
+            # instead of crawling every account again
+            account_id = self._search_account_by_name(name, account_type)
+            if account_id is not None:
+                index[key] = account_id
+                return account_id
+        else:
+            # Cache expired or never loaded: rebuild the index
+            index = self._refresh_account_index(account_type)
+            if key in index:
+                return index[key]
 
         # Create new account
         response = self._request(
@@ -611,8 +1587,55 @@ class FireflyClient:
             },
         )
 
-        data = response.json()
-        return int(data.get("data", {}).get("id", 0))
+        data = _parse_json(response)
+        account_id = int(data.get("data", {}).get("id", 0))
+        index[key] = account_id
+        self._drop_accounts_disk_cache(account_type)
+        return account_id
+
+    def _search_account_by_name(self, name: str, account_type: str) -> int | None:
+        """Find an account by exact (casefolded) name via the search endpoint."""
+        key = name.casefold()
+        params = {"query": name, "type": account_type, "field": "name"}
+        for data in self._paginate("/api/v1/search/accounts", params, parse=_parse_json_lazy):
+            for account in data.get("data", []):
+                if (account.get("attributes", {}).get("name") or "").casefold() == key:
+                    return int(account["id"])
+        return None
+
+    def _refresh_account_index(self, account_type: str) -> dict[str, int]:
+        """Rebuild the cached casefolded-name -> ID index for an account type.
+
+        Lists from the API rather than cache_dir: find_or_create_account()
+        creates any name missing here, so a stale listing would duplicate
+        accounts created elsewhere since it was written.
+        """
+        index: dict[str, int] = {}
+        for account in self._fetch_accounts(account_type, max_pages=10, include_identifiers=False):
+            if account.get("name"):
+                index.setdefault(account["name"].casefold(), int(account["id"]))
+        self._account_cache[account_type] = index
+        self._account_cache_ts[account_type] = time.monotonic()
+        return index
+
+    def invalidate_accounts_cache(self, account_type: str | None = None) -> None:
+        """
+        Drop cached name indexes and account listings persisted in cache_dir.
+
+        Args:
+            account_type: Only drop the account index of this type. By
+                default all account indexes and the category index are dropped.
+        """
+        self._drop_accounts_disk_cache(account_type)
+        if account_type is not None:
+            self._account_cache.pop(account_type, None)
+            self._account_cache_ts.pop(account_type, None)
+            return
+
+        self._account_cache.clear()
+        self._account_cache_ts.clear()
+        self._category_cache.clear()
+        self._category_cache_ts = None
 
     def list_currencies(self, enabled_only: bool = True) -> list[dict]:
         """
@@ -634,7 +1657,7 @@ class FireflyClient:
                 params={"page": page},
             )
 
-            data = response.json()
+            data = _parse_json(response)
             for currency in data.get("data", []):
                 attrs = currency.get("attributes", {})
                 is_enabled = attrs.get("enabled", True)
@@ -687,120 +1710,47 @@ class FireflyClient:
         Returns:
             List of FireflyTransaction objects (one per Firefly transaction, not per split)
         """
-        transactions = []
-        page = 1
-
-        while True:
-            params = {
-                "start": start_date,
-                "end": end_date,
-                "page": page,
-            }
-            if type_filter:
-                params["type"] = type_filter
-
-            response = self._request("GET", "/api/v1/transactions", params=params)
-            data = response.json()
-
-            for item in data.get("data", []):
-                attrs = item.get("attributes", {})
-                tx_list = attrs.get("transactions", [])
-
-                if not tx_list:
-                    continue
-
-                # Aggregate all splits into a single transaction
-                # Use first split for primary metadata, sum amounts
-                first_split = tx_list[0]
-                split_count = len(tx_list)
-                has_splits = split_count > 1
-
-                # Sum amounts from all splits
-                total_amount = sum(float(tx.get("amount", 0)) for tx in tx_list)
-
-                # Collect all unique tags across splits
-                all_tags: list[str] = []
-                for tx in tx_list:
-                    tx_tags = _normalize_tags(tx.get("tags"))
-                    if tx_tags:
-                        for tag in tx_tags:
-                            if tag not in all_tags:
-                                all_tags.append(tag)
-
-                # Build description that includes split info if relevant
-                description = first_split.get("description", "")
-                if has_splits:
-                    # Append indicator that this has splits
-                    split_summaries = [
-                        f"{tx.get('description', 'Split')} ({tx.get('amount', '?')})"
-                        for tx in tx_list[1:4]  # Show up to 3 additional splits
-                    ]
-                    if split_count > 4:
-                        split_summaries.append(f"... +{split_count - 4} more")
-                    # Keep original description primary, add split count note
-                    notes_suffix = f" [Split: {split_count} parts]"
-                else:
-                    notes_suffix = ""
-
-                # Get notes - combine with split indicator
-                existing_notes = first_split.get("notes") or ""
-                combined_notes = (
-                    (existing_notes + notes_suffix).strip()
-                    if notes_suffix
-                    else existing_notes or None
-                )
-
-                # Extract date in YYYY-MM-DD format for hash computation
-                tx_date = first_split.get("date", "")[:10]
-                source_name = first_split.get("source_name")
-                destination_name = first_split.get("destination_name")
+        if limit:
+            # Fetch sequentially so no pages past the limit are requested
+            return list(islice(self.iter_transactions(start_date, end_date, type_filter), limit))
 
-                # Compute hash-based external_id for deduplication
-                # This is computed even if external_id exists, for consistent dedup
-                computed_external_id = None
-                try:
-                    computed_external_id = generate_external_id_v2(
-                        amount=str(total_amount),
-                        date=tx_date,
-                        source=source_name,
-                        destination=destination_name,
-                        description=description,
-                    )
-                except (ValueError, TypeError):
-                    # If hash computation fails, continue without it
-                    pass
+        return list(
+            self.iter_transactions(
+                start_date, end_date, type_filter, max_workers=self.PAGE_FETCH_WORKERS
+            )
+        )
 
-                transactions.append(
-                    FireflyTransaction(
-                        id=int(item.get("id", 0)),
-                        type=first_split.get("type", ""),
-                        date=first_split.get("date", ""),
-                        amount=str(total_amount),
-                        description=description,
-                        external_id=first_split.get("external_id"),
-                        computed_external_id=computed_external_id,
-                        source_name=source_name,
-                        destination_name=destination_name,
-                        internal_reference=first_split.get("internal_reference"),
-                        notes=combined_notes,
-                        category_name=first_split.get("category_name"),
-                        tags=all_tags if all_tags else None,
-                        has_splits=has_splits,
-                        split_count=split_count,
-                    )
-                )
+    def iter_transactions(
+        self,
+        start_date: str,
+        end_date: str,
+        type_filter: str | None = None,
+        max_workers: int = 1,
+    ) -> Iterator[FireflyTransaction]:
+        """
+        Iterate transactions in a date range without buffering all of them.
 
-            # Check limit
-            if limit and len(transactions) >= limit:
-                return transactions[:limit]
+        Same results as list_transactions(). With the default max_workers=1
+        pages are fetched one at a time as iteration proceeds, so memory stays
+        bounded by a single page and callers can process-and-discard.
 
-            # Check for more pages
-            meta = data.get("meta", {}).get("pagination", {})
-            if page >= meta.get("total_pages", 1):
-                break
-            page += 1
+        Args:
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+            type_filter: Optional filter: withdrawal, deposit, transfer
+            max_workers: Number of pages fetched in parallel (see _paginate)
+        """
+        params = {"start": start_date, "end": end_date}
+        if type_filter:
+            params["type"] = type_filter
 
-        return transactions
+        for data in self._paginate(
+            "/api/v1/transactions",
+            params=params,
+            parse=_parse_json_lazy,
+            max_workers=max_workers,
+        ):
+            yield from _parse_transaction_page(data)
 
     def list_categories(self) -> list[FireflyCategory]:
         """
@@ -810,27 +1760,13 @@ class FireflyClient:
             List of FireflyCategory objects
         """
         categories = []
-        page = 1
-
-        while True:
-            response = self._request("GET", "/api/v1/categories", params={"page": page})
-            data = response.json()
-
-            for item in data.get("data", []):
-                attrs = item.get("attributes", {})
-                categories.append(
-                    FireflyCategory(
-                        id=int(item.get("id", 0)),
-                        name=attrs.get("name", ""),
-                        notes=attrs.get("notes"),
-                    )
-                )
 
-            # Check for more pages
-            meta = data.get("meta", {}).get("pagination", {})
-            if page >= meta.get("total_pages", 1):
-                break
-            page += 1
+        for data in self._paginate(
+            "/api/v1/categories",
+            parse=_parse_json_lazy,
+            max_workers=self.PAGE_FETCH_WORKERS,
+        ):
+            categories.extend(_parse_category(item) for item in data.get("data", []))
 
         return categories
 
@@ -846,7 +1782,7 @@ class FireflyClient:
 
         while True:
             response = self._request("GET", "/api/v1/tags", params={"page": page})
-            data = response.json()
+            data = _parse_json(response)
 
             for item in data.get("data", []):
                 attrs = item.get("attributes", {})
@@ -882,7 +1818,7 @@ class FireflyClient:
             payload["description"] = description
 
         response = self._request("POST", "/api/v1/tags", json_data=payload)
-        data = response.json()
+        data = _parse_json(response)
         return int(data.get("data", {}).get("id", 0))
 
     def find_tag_by_name(self, name: str) -> dict | None:
@@ -909,33 +1845,26 @@ class FireflyClient:
         Returns:
             List of piggy bank dictionaries
         """
-        piggy_banks = []
-        page = 1
+        return list(self.iter_piggy_banks())
 
-        while True:
-            response = self._request("GET", "/api/v1/piggy-banks", params={"page": page})
-            data = response.json()
+    def iter_piggy_banks(self) -> Iterator[dict]:
+        """
+        Iterate over all piggy banks from Firefly, one page at a time.
 
+        Yields the same dictionaries as list_piggy_banks() without holding every
+        page in memory.
+        """
+        for data in self._paginate("/api/v1/piggy-banks"):
             for item in data.get("data", []):
                 attrs = item.get("attributes", {})
-                piggy_banks.append(
-                    {
-                        "id": int(item.get("id", 0)),
-                        "name": attrs.get("name", ""),
-                        "target_amount": attrs.get("target_amount"),
-                        "current_amount": attrs.get("current_amount"),
-                        "account_id": attrs.get("account_id"),
-                        "notes": attrs.get("notes"),
-                    }
-                )
-
-            # Check for more pages
-            meta = data.get("meta", {}).get("pagination", {})
-            if page >= meta.get("total_pages", 1):
-                break
-            page += 1
-
-        return piggy_banks
+                yield {
+                    "id": int(item.get("id", 0)),
+                    "name": attrs.get("name", ""),
+                    "target_amount": attrs.get("target_amount"),
+                    "current_amount": attrs.get("current_amount"),
+                    "account_id": attrs.get("account_id"),
+                    "notes": attrs.get("notes"),
+                }
 
     def create_piggy_bank(
         self,
@@ -963,7 +1892,7 @@ class FireflyClient:
             payload["notes"] = notes
 
         response = self._request("POST", "/api/v1/piggy-banks", json_data=payload)
-        data = response.json()
+        data = _parse_json(response)
         return int(data.get("data", {}).get("id", 0))
 
     def find_piggy_bank_by_name(self, name: str) -> dict | None:
@@ -999,8 +1928,13 @@ class FireflyClient:
             payload["notes"] = notes
 
         response = self._request("POST", "/api/v1/categories", json_data=payload)
-        data = response.json()
-        return int(data.get("data", {}).get("id", 0))
+        data = _parse_json(response)
+        category_id = int(data.get("data", {}).get("id", 0))
+        if self._category_cache_ts is not None:
+            self._category_cache[name.casefold().strip()] = FireflyCategory(
+                id=category_id, name=name, notes=notes
+            )
+        return category_id
 
     def find_category_by_name(self, name: str) -> FireflyCategory | None:
         """
@@ -1012,12 +1946,19 @@ class FireflyClient:
         Returns:
             FireflyCategory or None if not found
         """
-        categories = self.list_categories()
-        name_lower = name.lower().strip()
-        for cat in categories:
-            if cat.name.lower().strip() == name_lower:
-                return cat
-        return None
+        name_lower = name.casefold().strip()
+        cached_at = self._category_cache_ts
+        if cached_at is not None and time.monotonic() - cached_at < self.NAME_CACHE_TTL:
+            category = self._category_cache.get(name_lower)
+            if category is not None:
+                return category
+
+        # Cache expired or name not cached yet: refresh the index
+        self._category_cache = {}
+        for cat in self.list_categories():
+            self._category_cache.setdefault(cat.name.casefold().strip(), cat)
+        self._category_cache_ts = time.monotonic()
+        return self._category_cache.get(name_lower)
 
     def get_unlinked_transactions(
         self,
@@ -1043,11 +1984,11 @@ class FireflyClient:
         """
         from ..schemas.linkage import is_linked_to_spark
 
-        all_transactions = self.list_transactions(start_date, end_date, type_filter)
-
         return [
             tx
-            for tx in all_transactions
+            for tx in self.iter_transactions(
+                start_date, end_date, type_filter, max_workers=self.PAGE_FETCH_WORKERS
+            )
             if not is_linked_to_spark(tx.external_id, tx.internal_reference, tx.notes)
         ]
 
@@ -1057,6 +1998,7 @@ class FireflyClient:
         external_id: str,
         internal_reference: str,
         notes_to_append: str,
+        existing: FireflyTransaction | None = None,
     ) -> bool:
         """
         Update an existing transaction with linkage markers.
@@ -1068,42 +2010,44 @@ class FireflyClient:
             external_id: External ID to set
             internal_reference: Internal reference to set
             notes_to_append: Text to append to existing notes
+            existing: The transaction as previously returned by this client.
+                For single-split transactions this allows a partial PUT of
+                just the changed fields, without fetching the group first.
 
         Returns:
             True if updated successfully
         """
-        # Get existing transaction to preserve data
-        existing = self.get_transaction(transaction_id)
-        if not existing:
-            raise FireflyAPIError(404, f"Transaction {transaction_id} not found")
-
-        # Build notes (append to existing)
-        new_notes = existing.notes or ""
-        if new_notes:
-            new_notes += "\n\n"
-        new_notes += notes_to_append
-
-        # Update via PUT - need to get full transaction data first
-        response = self._request("GET", f"/api/v1/transactions/{transaction_id}")
-        data = response.json().get("data", {})
-        attrs = data.get("attributes", {})
-        tx_list = attrs.get("transactions", [])
-
-        if not tx_list:
-            raise FireflyAPIError(500, f"Transaction {transaction_id} has no splits")
-
-        # Update the first split with linkage
-        tx = tx_list[0]
-        tx["external_id"] = external_id
-        tx["internal_reference"] = internal_reference
-        tx["notes"] = new_notes
+        if self._can_update_split_directly(existing):
+            fields = {
+                "external_id": external_id,
+                "internal_reference": internal_reference,
+                "notes": self._append_notes(existing.notes, notes_to_append),
+            }
+            self._update_split_fields(transaction_id, existing.transaction_journal_id, fields)
+        else:
+            data = self._get_full_transaction(transaction_id)
+            attrs = data.get("attributes", {})
+            tx_list = attrs.get("transactions", [])
+
+            if not tx_list:
+                raise FireflyAPIError(500, f"Transaction {transaction_id} has no splits")
+
+            # Update the first split with linkage; the full split list is sent
+            # back so Firefly keeps the other splits of the group.
+            tx = tx_list[0]
+            tx["external_id"] = external_id
+            tx["internal_reference"] = internal_reference
+            tx["notes"] = self._append_notes(tx.get("notes"), notes_to_append)
+
+            self._request(
+                "PUT",
+                f"/api/v1/transactions/{transaction_id}",
+                json_data={"transactions": tx_list},
+            )
+            self._invalidate_transaction(transaction_id)
 
-        # Send update
-        self._request(
-            "PUT",
-            f"/api/v1/transactions/{transaction_id}",
-            json_data={"transactions": tx_list},
-        )
+        self._forget_external_ids_of(transaction_id)
+        self._remember_external_id(external_id, transaction_id)
 
         logger.info(f"Updated transaction {transaction_id} with linkage markers")
         return True
@@ -1112,6 +2056,7 @@ class FireflyClient:
         self,
         transaction_id: int,
         external_id: str,
+        existing: FireflyTransaction | None = None,
     ) -> bool:
         """
         Set the external_id for a transaction (without other changes).
@@ -1125,37 +2070,78 @@ class FireflyClient:
         Args:
             transaction_id: Firefly transaction ID
             external_id: External ID to set (typically computed hash)
+            existing: The transaction as previously returned by this client.
+                For single-split transactions this allows a partial PUT
+                without fetching the group first.
 
         Returns:
             True if updated successfully, False if transaction already has external_id
         """
-        # Get full transaction data
-        response = self._request("GET", f"/api/v1/transactions/{transaction_id}")
-        data = response.json().get("data", {})
-        attrs = data.get("attributes", {})
-        tx_list = attrs.get("transactions", [])
+        if self._can_update_split_directly(existing):
+            if existing.external_id:
+                logger.debug(f"Transaction {transaction_id} already has external_id, skipping")
+                return False
+            self._update_split_fields(
+                transaction_id, existing.transaction_journal_id, {"external_id": external_id}
+            )
+        else:
+            # Get full transaction data
+            data = self._get_full_transaction(transaction_id)
+            attrs = data.get("attributes", {})
+            tx_list = attrs.get("transactions", [])
 
-        if not tx_list:
-            raise FireflyAPIError(500, f"Transaction {transaction_id} has no splits")
+            if not tx_list:
+                raise FireflyAPIError(500, f"Transaction {transaction_id} has no splits")
 
-        # Check if external_id is already set
-        first_split = tx_list[0]
-        if first_split.get("external_id"):
-            logger.debug(f"Transaction {transaction_id} already has external_id, skipping")
-            return False
+            # Check if external_id is already set
+            first_split = tx_list[0]
+            if first_split.get("external_id"):
+                logger.debug(f"Transaction {transaction_id} already has external_id, skipping")
+                return False
+
+            # Set external_id on first split
+            first_split["external_id"] = external_id
+
+            # Send update
+            self._request(
+                "PUT",
+                f"/api/v1/transactions/{transaction_id}",
+                json_data={"transactions": tx_list},
+            )
+            self._invalidate_transaction(transaction_id)
+
+        self._remember_external_id(external_id, transaction_id)
+
+        logger.info(f"Set external_id for transaction {transaction_id}: {external_id}")
+        return True
 
-        # Set external_id on first split
-        first_split["external_id"] = external_id
+    @staticmethod
+    def _can_update_split_directly(existing: FireflyTransaction | None) -> bool:
+        """
+        Check whether a partial PUT addressing one split is safe.
 
-        # Send update
+        Firefly replaces the whole split list on update, so a partial list is
+        only safe when the group has exactly one split.
+        """
+        return (
+            existing is not None
+            and existing.split_count == 1
+            and existing.transaction_journal_id is not None
+        )
+
+    @staticmethod
+    def _append_notes(notes: str | None, notes_to_append: str) -> str:
+        """Append a block of text to existing notes, separated by a blank line."""
+        return f"{notes}\n\n{notes_to_append}" if notes else notes_to_append
+
+    def _update_split_fields(self, transaction_id: int, journal_id: int, fields: dict) -> None:
+        """PUT only the given fields of a single-split transaction."""
         self._request(
             "PUT",
             f"/api/v1/transactions/{transaction_id}",
-            json_data={"transactions": tx_list},
+            json_data={"transactions": [{"transaction_journal_id": journal_id, **fields}]},
         )
-
-        logger.info(f"Set external_id for transaction {transaction_id}: {external_id}")
-        return True
+        self._invalidate_transaction(transaction_id)
 
     # =========================================================================
     # Budget Methods (Sync Assistant - Everything)
@@ -1168,34 +2154,27 @@ class FireflyClient:
         Returns:
             List of budget dictionaries with id, name, auto_budget_type, etc.
         """
-        budgets = []
-        page = 1
+        return list(self.iter_budgets())
 
-        while True:
-            response = self._request("GET", "/api/v1/budgets", params={"page": page})
-            data = response.json()
+    def iter_budgets(self) -> Iterator[dict]:
+        """
+        Iterate over all budgets from Firefly, one page at a time.
 
+        Yields the same dictionaries as list_budgets() without holding every
+        page in memory.
+        """
+        for data in self._paginate("/api/v1/budgets"):
             for item in data.get("data", []):
                 attrs = item.get("attributes", {})
-                budgets.append(
-                    {
-                        "id": int(item.get("id", 0)),
-                        "name": attrs.get("name", ""),
-                        "auto_budget_type": attrs.get("auto_budget_type"),
-                        "auto_budget_amount": attrs.get("auto_budget_amount"),
-                        "auto_budget_period": attrs.get("auto_budget_period"),
-                        "notes": attrs.get("notes"),
-                        "active": attrs.get("active", True),
-                    }
-                )
-
-            # Check for more pages
-            meta = data.get("meta", {}).get("pagination", {})
-            if page >= meta.get("total_pages", 1):
-                break
-            page += 1
-
-        return budgets
+                yield {
+                    "id": int(item.get("id", 0)),
+                    "name": attrs.get("name", ""),
+                    "auto_budget_type": attrs.get("auto_budget_type"),
+                    "auto_budget_amount": attrs.get("auto_budget_amount"),
+                    "auto_budget_period": attrs.get("auto_budget_period"),
+                    "notes": attrs.get("notes"),
+                    "active": attrs.get("active", True),
+                }
 
     def create_budget(
         self,
@@ -1229,7 +2208,7 @@ class FireflyClient:
             payload["notes"] = notes
 
         response = self._request("POST", "/api/v1/budgets", json_data=payload)
-        data = response.json()
+        data = _parse_json(response)
         return int(data.get("data", {}).get("id", 0))
 
     def find_budget_by_name(self, name: str) -> dict | None:
@@ -1260,37 +2239,30 @@ class FireflyClient:
         Returns:
             List of bill dictionaries
         """
-        bills = []
-        page = 1
+        return list(self.iter_bills())
 
-        while True:
-            response = self._request("GET", "/api/v1/bills", params={"page": page})
-            data = response.json()
+    def iter_bills(self) -> Iterator[dict]:
+        """
+        Iterate over all bills from Firefly, one page at a time.
 
+        Yields the same dictionaries as list_bills() without holding every
+        page in memory.
+        """
+        for data in self._paginate("/api/v1/bills"):
             for item in data.get("data", []):
                 attrs = item.get("attributes", {})
-                bills.append(
-                    {
-                        "id": int(item.get("id", 0)),
-                        "name": attrs.get("name", ""),
-                        "amount_min": attrs.get("amount_min"),
-                        "amount_max": attrs.get("amount_max"),
-                        "date": attrs.get("date"),
-                        "repeat_freq": attrs.get("repeat_freq"),
-                        "skip": attrs.get("skip", 0),
-                        "active": attrs.get("active", True),
-                        "notes": attrs.get("notes"),
-                        "currency_code": attrs.get("currency_code"),
-                    }
-                )
-
-            # Check for more pages
-            meta = data.get("meta", {}).get("pagination", {})
-            if page >= meta.get("total_pages", 1):
-                break
-            page += 1
-
-        return bills
+                yield {
+                    "id": int(item.get("id", 0)),
+                    "name": attrs.get("name", ""),
+                    "amount_min": attrs.get("amount_min"),
+                    "amount_max": attrs.get("amount_max"),
+                    "date": attrs.get("date"),
+                    "repeat_freq": attrs.get("repeat_freq"),
+                    "skip": attrs.get("skip", 0),
+                    "active": attrs.get("active", True),
+                    "notes": attrs.get("notes"),
+                    "currency_code": attrs.get("currency_code"),
+                }
 
     def create_bill(
         self,
@@ -1335,7 +2307,7 @@ class FireflyClient:
             payload["notes"] = notes
 
         response = self._request("POST", "/api/v1/bills", json_data=payload)
-        data = response.json()
+        data = _parse_json(response)
         return int(data.get("data", {}).get("id", 0))
 
     def find_bill_by_name(self, name: str) -> dict | None:
@@ -1371,7 +2343,7 @@ class FireflyClient:
 
         while True:
             response = self._request("GET", "/api/v1/rule-groups", params={"page": page})
-            data = response.json()
+            data = _parse_json(response)
 
             for item in data.get("data", []):
                 attrs = item.get("attributes", {})
@@ -1419,7 +2391,7 @@ class FireflyClient:
             payload["description"] = description
 
         response = self._request("POST", "/api/v1/rule-groups", json_data=payload)
-        data = response.json()
+        data = _parse_json(response)
         return int(data.get("data", {}).get("id", 0))
 
     def find_rule_group_by_title(self, title: str) -> dict | None:
@@ -1450,37 +2422,30 @@ class FireflyClient:
         Returns:
             List of rule dictionaries with triggers and actions
         """
-        rules = []
-        page = 1
+        return list(self.iter_rules())
 
-        while True:
-            response = self._request("GET", "/api/v1/rules", params={"page": page})
-            data = response.json()
+    def iter_rules(self) -> Iterator[dict]:
+        """
+        Iterate over all rules from Firefly, one page at a time.
 
+        Yields the same dictionaries as list_rules() without holding every
+        page in memory.
+        """
+        for data in self._paginate("/api/v1/rules"):
             for item in data.get("data", []):
                 attrs = item.get("attributes", {})
-                rules.append(
-                    {
-                        "id": int(item.get("id", 0)),
-                        "title": attrs.get("title", ""),
-                        "rule_group_id": attrs.get("rule_group_id"),
-                        "rule_group_title": attrs.get("rule_group_title"),
-                        "order": attrs.get("order"),
-                        "active": attrs.get("active", True),
-                        "strict": attrs.get("strict", False),
-                        "triggers": attrs.get("triggers", []),
-                        "actions": attrs.get("actions", []),
-                        "description": attrs.get("description"),
-                    }
-                )
-
-            # Check for more pages
-            meta = data.get("meta", {}).get("pagination", {})
-            if page >= meta.get("total_pages", 1):
-                break
-            page += 1
-
-        return rules
+                yield {
+                    "id": int(item.get("id", 0)),
+                    "title": attrs.get("title", ""),
+                    "rule_group_id": attrs.get("rule_group_id"),
+                    "rule_group_title": attrs.get("rule_group_title"),
+                    "order": attrs.get("order"),
+                    "active": attrs.get("active", True),
+                    "strict": attrs.get("strict", False),
+                    "triggers": attrs.get("triggers", []),
+                    "actions": attrs.get("actions", []),
+                    "description": attrs.get("description"),
+                }
 
     def create_rule(
         self,
@@ -1523,7 +2488,7 @@ class FireflyClient:
             payload["description"] = description
 
         response = self._request("POST", "/api/v1/rules", json_data=payload)
-        data = response.json()
+        data = _parse_json(response)
         return int(data.get("data", {}).get("id", 0))
 
     def find_rule_by_title(self, title: str) -> dict | None:
@@ -1554,36 +2519,29 @@ class FireflyClient:
         Returns:
             List of recurrence dictionaries
         """
-        recurrences = []
-        page = 1
+        return list(self.iter_recurrences())
 
-        while True:
-            response = self._request("GET", "/api/v1/recurrences", params={"page": page})
-            data = response.json()
+    def iter_recurrences(self) -> Iterator[dict]:
+        """
+        Iterate over all recurrences from Firefly, one page at a time.
 
+        Yields the same dictionaries as list_recurrences() without holding every
+        page in memory.
+        """
+        for data in self._paginate("/api/v1/recurrences"):
             for item in data.get("data", []):
                 attrs = item.get("attributes", {})
-                recurrences.append(
-                    {
-                        "id": int(item.get("id", 0)),
-                        "title": attrs.get("title", ""),
-                        "first_date": attrs.get("first_date"),
-                        "latest_date": attrs.get("latest_date"),
-                        "repeat_freq": attrs.get("repeat_until"),
-                        "repetitions": attrs.get("repetitions", []),
-                        "transactions": attrs.get("transactions", []),
-                        "notes": attrs.get("notes"),
-                        "active": attrs.get("active", True),
-                    }
-                )
-
-            # Check for more pages
-            meta = data.get("meta", {}).get("pagination", {})
-            if page >= meta.get("total_pages", 1):
-                break
-            page += 1
-
-        return recurrences
+                yield {
+                    "id": int(item.get("id", 0)),
+                    "title": attrs.get("title", ""),
+                    "first_date": attrs.get("first_date"),
+                    "latest_date": attrs.get("latest_date"),
+                    "repeat_freq": attrs.get("repeat_until"),
+                    "repetitions": attrs.get("repetitions", []),
+                    "transactions": attrs.get("transactions", []),
+                    "notes": attrs.get("notes"),
+                    "active": attrs.get("active", True),
+                }
 
     def create_recurrence(
         self,
@@ -1638,7 +2596,7 @@ class FireflyClient:
             payload["notes"] = notes
 
         response = self._request("POST", "/api/v1/recurrences", json_data=payload)
-        data = response.json()
+        data = _parse_json(response)
         return int(data.get("data", {}).get("id", 0))
 
     def find_recurrence_by_title(self, title: str) -> dict | None:
@@ -1695,3 +2653,66 @@ class FireflyClient:
             if curr["code"].upper().strip() == code_upper:
                 return curr
         return None
+
+    # =========================================================================
+    # Bulk Creation Methods (Sync Assistant - Everything)
+    # =========================================================================
+
+    # Entity kind -> name of the create_* method used by create_many()
+    CREATE_METHODS = {
+        "category": "create_category",
+        "tag": "create_tag",
+        "piggy_bank": "create_piggy_bank",
+        "budget": "create_budget",
+        "bill": "create_bill",
+        "rule_group": "create_rule_group",
+        "rule": "create_rule",
+        "recurrence": "create_recurrence",
+    }
+
+    def create_many(
+        self,
+        kind: str,
+        items: list[dict],
+        max_workers: int = 8,
+    ) -> list[int | Exception]:
+        """
+        Create many entities of one kind concurrently.
+
+        Each item is passed as keyword arguments to the matching create_*
+        method (e.g. kind="budget" calls create_budget(**item)). Requests are
+        dispatched over the shared, connection-pooled session.
+
+        Args:
+            kind: Entity kind, one of CREATE_METHODS
+            items: Keyword arguments for each entity to create
+            max_workers: Maximum number of concurrent requests
+
+        Returns:
+            One entry per item, in input order: the new entity ID, or the
+            exception raised while creating it. Callers decide whether to
+            fail fast or continue on errors.
+
+        Raises:
+            ValueError: If kind is not supported
+        """
+        method_name = self.CREATE_METHODS.get(kind)
+        if method_name is None:
+            raise ValueError(
+                f"Unsupported kind '{kind}', expected one of: {', '.join(self.CREATE_METHODS)}"
+            )
+        create = getattr(self, method_name)
+
+        def create_one(item: dict) -> int | Exception:
+            try:
+                return create(**item)
+            except Exception as e:
+                logger.warning("Failed to create %s %s: %s", kind, item, e)
+                return e
+
+        if not items:
+            return []
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # executor.map preserves submission order
+            return list(executor.map(create_one, items))
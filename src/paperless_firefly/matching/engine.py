@@ -7,20 +7,190 @@ extracted document data and existing Firefly transactions.
 
 from __future__ import annotations
 
+import heapq
 import logging
+import re
+import sys
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
+from functools import lru_cache
+from itertools import chain
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from paperless_firefly.config import Config, ReconciliationConfig
     from paperless_firefly.state_store import StateStore
 
 logger = logging.getLogger(__name__)
 
+# Minimum total score for a candidate to be suggested. Kept low so that more
+# suggestions are shown for user review.
+_MIN_MATCH_SCORE = 0.20
+
+# Amounts are compared as integer ten-thousandths so scoring needs no Decimal math
+_AMOUNT_SCALE = 10000
+
+# Amount tolerance tiers: (max difference in percent, score, detail template)
+_AMOUNT_TIERS = (
+    (1, 0.95, "~1%: {extracted} vs {transaction}"),
+    (5, 0.7, "~5%: {extracted} vs {transaction}"),
+    # Within 10% tolerance - still useful for manual review
+    (10, 0.4, "~10%: {extracted} vs {transaction}"),
+    # Within 20% - could be rounding differences or fees
+    (20, 0.2, "~20%: {extracted} vs {transaction}"),
+)
+
+# Firefly and most extractions use ISO dates, which are parsed without strptime
+_ISO_DATE_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+# Fallback formats, tried in order on the first 10 characters
+_DATE_FORMATS = ("%Y-%m-%d", "%d/%m/%Y", "%m/%d/%Y")
+
+_REASON_LABELS = {
+    "amount": "amount_match",
+    "date": "date_close",
+    "description": "description_match",
+    "vendor": "vendor_match",
+}
+
+
+def _normalize(value: str | None) -> str | None:
+    """Lowercase and strip a text field; None if it is missing or empty.
+
+    The result is interned: the same vendor and description strings recur
+    across thousands of candidates, so they share one object and equality
+    checks (including scorer cache lookups) succeed on identity.
+    """
+    return sys.intern(value.lower().strip()) if value else None
+
+
+@lru_cache(maxsize=8192)
+def _parse_date_text(value: str) -> datetime | None:
+    """Parse the date at the start of a string; None if no format matches."""
+    head = value[:10]
+    if _ISO_DATE_RE.fullmatch(head):
+        try:
+            return datetime(int(head[:4]), int(head[5:7]), int(head[8:10]))
+        except ValueError:
+            return None
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(head, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def _words(value: str | None) -> frozenset[str] | None:
+    """Word set of a normalized text field, for the description overlap score."""
+    return frozenset(value.split()) if value is not None else None
 
-@dataclass
+
+def _to_units(amount: Decimal | None) -> int | None:
+    """Convert a parsed amount to integer ten-thousandths; None if missing."""
+    if amount is None or not amount.is_finite():
+        return None
+    return int((amount * _AMOUNT_SCALE).to_integral_value())
+
+
+def _amount_band(units: int) -> tuple[int, int]:
+    """Range of amounts (in units) that can score above zero against units."""
+    widest = _AMOUNT_TIERS[-1][0]
+    # |units - t| * 100 <= widest * |t| bounds t between these two quotients
+    numerator = units * 100
+    near, far = 100 + widest, 100 - widest
+    lo = min(numerator // near, numerator // far)
+    hi = max(-(-numerator // near), -(-numerator // far))
+    return lo, hi
+
+
+def _amount_score(extracted: int | None, transaction: int | None) -> tuple[float, str]:
+    """Score two amounts in ten-thousandths, returning (score, detail template)."""
+    if extracted is None or transaction is None:
+        return 0.0, "missing"
+    if extracted == transaction:
+        return 1.0, "exact: {extracted}"
+    if transaction:
+        diff = abs(extracted - transaction) * 100
+        base = abs(transaction)
+        for limit, score, template in _AMOUNT_TIERS:
+            if diff <= limit * base:
+                return score, template
+    return 0.0, "mismatch: {extracted} vs {transaction}"
+
+
+def _date_score(days_diff: int | None, tolerance: int) -> tuple[float, str]:
+    """Score date proximity from an absolute day difference.
+
+    Returns (score, detail template).
+    """
+    if days_diff is None:
+        return 0.0, "missing"
+    if days_diff == 0:
+        return 1.0, "same day"
+    if days_diff <= tolerance:
+        # Linear decay within tolerance
+        return max(1.0 - (days_diff / (tolerance + 1)), 0.3), "{days} days"
+    # Beyond tolerance but within 2x tolerance - still show as possibility
+    if days_diff <= tolerance * 2:
+        return 0.2, "{days} days (extended)"
+    # Up to 30 days - could be month end processing
+    if days_diff <= 30:
+        return 0.1, "{days} days (month)"
+    return 0.0, ">{tolerance} days"
+
+
+# The text scorers are memoized: vendor names and descriptions repeat across
+# candidates, and the same pairs come back whenever a document is re-matched.
+@lru_cache(maxsize=4096)
+def _description_score(
+    extracted: str | None,
+    transaction: str | None,
+    extracted_words: frozenset[str] | None,
+    transaction_words: frozenset[str] | None,
+) -> tuple[float, str]:
+    """Score two normalized descriptions and their word sets, returning (score, detail)."""
+    if extracted is None or transaction is None:
+        return 0.0, "missing"
+    if extracted == transaction:
+        return 1.0, "exact"
+    if extracted in transaction or transaction in extracted:
+        return 0.8, "contains"
+    # Word overlap (simple Jaccard-like). The overlap is at most the smaller
+    # set's size over the larger one's, so lopsided pairs are rejected
+    # without intersecting, and the union size follows from the intersection.
+    if extracted_words and transaction_words:
+        smaller, larger = sorted((len(extracted_words), len(transaction_words)))
+        if smaller / larger > 0.3:
+            shared = len(extracted_words & transaction_words)
+            jaccard = shared / (smaller + larger - shared)
+            if jaccard > 0.3:
+                return jaccard, f"overlap: {shared} words"
+    return 0.0, "no match"
+
+
+@lru_cache(maxsize=4096)
+def _vendor_score(extracted: str | None, transaction: str | None) -> tuple[float, str]:
+    """Score two normalized vendor names, returning (score, detail)."""
+    if extracted is None or transaction is None:
+        return 0.0, "missing"
+    if extracted == transaction:
+        return 1.0, "exact"
+    # Contains check (handles "Amazon.com" vs "Amazon")
+    if extracted in transaction or transaction in extracted:
+        return 0.85, "contains"
+    # Check first significant word
+    ext_first = extracted.split()[0] if extracted else ""
+    tx_first = transaction.split()[0] if transaction else ""
+    if ext_first and tx_first and ext_first == tx_first:
+        return 0.6, "first word"
+    return 0.0, "no match"
+
+
+@dataclass(slots=True)
 class MatchScore:
     """Individual signal contribution to a match score."""
 
@@ -35,7 +205,7 @@ class MatchScore:
         return self.score * self.weight
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchResult:
     """Result of matching a document extraction to a Firefly transaction."""
 
@@ -73,6 +243,103 @@ class MatchResult:
         }
 
 
+class _CandidateCache:
+    """Unmatched Firefly transactions split into pre-parsed columns.
+
+    Every candidate is scored for every document, so amounts and dates are
+    parsed and text fields normalized once here; the scoring loop in
+    find_matches() then only reads plain lists.
+
+    Rows that are unchanged since the previous cache (same firefly_id and
+    identical row contents) reuse its parsed values instead of being
+    parsed again.
+
+    Rows are also indexed by amount so find_matches() can score the
+    candidates within amount tolerance first.
+    """
+
+    __slots__ = (
+        "rows",
+        "positions",
+        "amounts",
+        "units",
+        "dates",
+        "days",
+        "descriptions",
+        "description_words",
+        "vendors",
+        "sorted_units",
+        "sorted_rows",
+    )
+
+    def __init__(
+        self,
+        rows: list[dict],
+        parse_amount: Callable[[str | float | None], Decimal | None],
+        parse_date: Callable[[str | datetime | None], datetime | None],
+        previous: _CandidateCache | None = None,
+    ) -> None:
+        self.rows = rows
+        self.positions: dict[int, int] = {}
+        self.amounts: list[Decimal | None] = []
+        self.units: list[int | None] = []
+        self.dates: list[datetime | None] = []
+        self.days: list[int | None] = []
+        self.descriptions: list[str | None] = []
+        self.description_words: list[frozenset[str] | None] = []
+        self.vendors: list[str | None] = []
+
+        for i, row in enumerate(rows):
+            firefly_id = row["firefly_id"]
+            self.positions[firefly_id] = i
+
+            j = previous.positions.get(firefly_id) if previous is not None else None
+            if j is not None and previous.rows[j] == row:
+                amount = previous.amounts[j]
+                units = previous.units[j]
+                date = previous.dates[j]
+                day = previous.days[j]
+                description = previous.descriptions[j]
+                description_words = previous.description_words[j]
+                vendor = previous.vendors[j]
+            else:
+                amount = parse_amount(row.get("amount"))
+                units = _to_units(amount)
+                date = parse_date(row.get("date"))
+                day = date.toordinal() if date is not None else None
+                description = _normalize(row.get("description", ""))
+                description_words = _words(description)
+                vendor = _normalize(row.get("destination_account") or row.get("source_account"))
+
+            self.amounts.append(amount)
+            self.units.append(units)
+            self.dates.append(date)
+            self.days.append(day)
+            self.descriptions.append(description)
+            self.description_words.append(description_words)
+            self.vendors.append(vendor)
+
+        ranked = sorted((units, i) for i, units in enumerate(self.units) if units is not None)
+        self.sorted_units = [units for units, _ in ranked]
+        self.sorted_rows = [i for _, i in ranked]
+
+    def amount_neighbours(self, units: int | None) -> list[int]:
+        """Row indices whose amount is within tolerance of units."""
+        if units is None:
+            return []
+        lo, hi = _amount_band(units)
+        start = bisect_left(self.sorted_units, lo)
+        end = bisect_right(self.sorted_units, hi, lo=start)
+        return self.sorted_rows[start:end]
+
+
+# Last parsed candidates per state database. The review views build a new
+# MatchingEngine for every request, so keeping this per process rather than
+# per engine lets those requests reuse the parsed rows too. Entries are only
+# replaced, never mutated, so concurrent readers always see a whole cache.
+_shared_candidates: dict[str, _CandidateCache] = {}
+
+
 class MatchingEngine:
     """Engine for matching Paperless document extractions to Firefly transactions.
 
@@ -107,6 +374,10 @@ class MatchingEngine:
         self.config = config
         self.recon_config: ReconciliationConfig = config.reconciliation
 
+        # Parsed candidates are shared by every engine on the same database
+        # (see _shared_candidates)
+        self._cache_key = str(state_store.db_path)
+
     def find_matches(
         self,
         document_id: int,
@@ -126,14 +397,66 @@ class MatchingEngine:
         Returns:
             List of MatchResult sorted by score descending.
         """
-        results: list[MatchResult] = []
+        candidates = self._load_candidates(user_id)
+        if candidates is None:
+            return []
+        return self._rank_candidates(candidates, document_id, extraction, max_results)
 
+    def find_matches_batch(
+        self,
+        jobs: list[tuple[int, dict]],
+        max_results: int = 5,
+        user_id: int | None = None,
+    ) -> list[list[MatchResult]]:
+        """Find matches for several documents against one load of the cache.
+
+        Equivalent to calling find_matches() for each job, but the unmatched
+        transactions are read from the state store once for the whole batch.
+        Only use it when nothing changes the unmatched set between the
+        documents (e.g. no auto-matching in between).
+
+        Args:
+            jobs: (document_id, extraction) pairs.
+            max_results: Maximum number of match results per document.
+            user_id: User ID to filter transactions by (see find_matches).
+
+        Returns:
+            One list of MatchResult per job, in job order.
+        """
+        candidates = self._load_candidates(user_id)
+        if candidates is None:
+            return [[] for _ in jobs]
+        return [
+            self._rank_candidates(candidates, document_id, extraction, max_results)
+            for document_id, extraction in jobs
+        ]
+
+    def _load_candidates(self, user_id: int | None) -> _CandidateCache | None:
+        """Load the unmatched transactions, reusing parsed rows where possible."""
         # Get unmatched cached transactions, filtered by user_id for privacy
         cached_transactions = self.store.get_unmatched_firefly_transactions(user_id=user_id)
 
         if not cached_transactions:
             logger.debug("No unmatched transactions in cache for matching")
-            return results
+            return None
+
+        candidates = _shared_candidates.get(self._cache_key)
+        if candidates is None or candidates.rows != cached_transactions:
+            candidates = _CandidateCache(
+                cached_transactions, self._parse_amount, self._parse_date, previous=candidates
+            )
+            _shared_candidates[self._cache_key] = candidates
+        return candidates
+
+    def _rank_candidates(
+        self,
+        candidates: _CandidateCache,
+        document_id: int,
+        extraction: dict,
+        max_results: int,
+    ) -> list[MatchResult]:
+        """Score the loaded candidates against one extraction (see find_matches)."""
+        cached_transactions = candidates.rows
 
         extracted_amount = self._parse_amount(extraction.get("amount"))
         extracted_date = self._parse_date(extraction.get("date"))
@@ -142,77 +465,128 @@ class MatchingEngine:
         # Get source account from extraction for exact matching
         extracted_source = extraction.get("source_account")
 
-        for tx in cached_transactions:
-            signals: list[MatchScore] = []
-            reasons: list[str] = []
-
-            # Amount matching
-            tx_amount = self._parse_amount(tx.get("amount"))
-            amount_score = self._score_amount(extracted_amount, tx_amount)
-            signals.append(amount_score)
-            if amount_score.score > 0.5:
-                reasons.append(f"amount_match ({amount_score.detail})")
-
-            # Date matching
-            tx_date = self._parse_date(tx.get("date"))
-            date_score = self._score_date(extracted_date, tx_date)
-            signals.append(date_score)
-            if date_score.score > 0.5:
-                reasons.append(f"date_close ({date_score.detail})")
-
-            # Description matching
-            tx_description = tx.get("description", "")
-            desc_score = self._score_description(extracted_description, tx_description)
-            signals.append(desc_score)
-            if desc_score.score > 0.5:
-                reasons.append(f"description_match ({desc_score.detail})")
-
-            # Vendor matching
-            tx_vendor = tx.get("destination_account") or tx.get("source_account")
-            vendor_score = self._score_vendor(extracted_vendor, tx_vendor)
-            signals.append(vendor_score)
-            if vendor_score.score > 0.5:
-                reasons.append(f"vendor_match ({vendor_score.detail})")
-
-            # Calculate total weighted score
-            total_score = sum(s.weighted_score for s in signals)
+        extracted_units = _to_units(extracted_amount)
+        extracted_day = extracted_date.toordinal() if extracted_date is not None else None
+        ext_description = _normalize(extracted_description)
+        ext_description_words = _words(ext_description)
+        ext_vendor = _normalize(extracted_vendor)
+        tolerance = self.recon_config.date_tolerance_days
+
+        # Score every candidate with plain floats; the MatchScore/MatchResult
+        # breakdown is only built for the candidates that are returned.
+        # Candidates within amount tolerance go first so the score needed to
+        # make the top max_results rises early; after that, candidates whose
+        # amount and date leave them short even with perfect description and
+        # vendor scores are skipped without comparing text.
+        neighbours = candidates.amount_neighbours(extracted_units)
+        skip = set(neighbours)
+        order = chain(neighbours, (i for i in range(len(candidates.rows)) if i not in skip))
+
+        # The weights, columns and scorers are fixed for the whole pass; bind
+        # them to locals so the loop doesn't repeat the attribute lookups
+        weight_amount = self.WEIGHT_AMOUNT
+        weight_date = self.WEIGHT_DATE
+        weight_description = self.WEIGHT_DESCRIPTION
+        weight_vendor = self.WEIGHT_VENDOR
+        units = candidates.units
+        days = candidates.days
+        descriptions = candidates.descriptions
+        description_words = candidates.description_words
+        vendors = candidates.vendors
+        amount_score = _amount_score
+        date_score = _date_score
+        description_score = _description_score
+        vendor_score = _vendor_score
+
+        scored: list[tuple[float, int, bool]] = []
+        top: list[float] = []
+        cutoff = _MIN_MATCH_SCORE
+        for i in order:
+            tx_units = units[i]
+            tx_day = days[i]
+            days_diff = None
+            if extracted_day is not None and tx_day is not None:
+                days_diff = abs(extracted_day - tx_day)
+
+            partial_score = (
+                amount_score(extracted_units, tx_units)[0] * weight_amount
+                + date_score(days_diff, tolerance)[0] * weight_date
+            )
 
             # Check for exact match: amount exact + date same day + account match
             # Account match = either source OR destination matches
-            is_exact = self._is_exact_match(
-                extracted_amount=extracted_amount,
-                extracted_date=extracted_date,
-                extracted_vendor=extracted_vendor,
-                extracted_source=extracted_source,
-                tx_amount=tx_amount,
-                tx_date=tx_date,
-                tx_source=tx.get("source_account"),
-                tx_destination=tx.get("destination_account"),
+            is_exact = False
+            if days_diff == 0 and extracted_units is not None and extracted_units == tx_units:
+                tx = cached_transactions[i]
+                is_exact = self._is_exact_match(
+                    extracted_amount=extracted_amount,
+                    extracted_date=extracted_date,
+                    extracted_vendor=extracted_vendor,
+                    extracted_source=extracted_source,
+                    tx_amount=candidates.amounts[i],
+                    tx_date=candidates.dates[i],
+                    tx_source=tx.get("source_account"),
+                    tx_destination=tx.get("destination_account"),
+                )
+
+            if not is_exact and partial_score + weight_description + weight_vendor < cutoff:
+                continue
+
+            total_score = (
+                partial_score
+                + description_score(
+                    ext_description, descriptions[i], ext_description_words, description_words[i]
+                )[0]
+                * weight_description
+                + vendor_score(ext_vendor, vendors[i])[0] * weight_vendor
             )
-            
             if is_exact:
-                reasons.append("EXACT_MATCH (amount+date+account)")
                 # Boost score for exact matches to ensure they're at the top
                 total_score = max(total_score, 0.99)
 
-            # Only include if score is above minimum threshold
-            # Lower threshold (0.20) to show more suggestions for user review
-            if total_score >= 0.20:  # Minimum viable match - show in suggestions
-                results.append(
-                    MatchResult(
-                        firefly_id=tx["firefly_id"],
-                        document_id=document_id,
-                        total_score=total_score,
-                        signals=signals,
-                        reasons=reasons,
-                        is_exact_match=is_exact,
-                    )
-                )
+            if total_score >= _MIN_MATCH_SCORE:
+                scored.append((total_score, i, is_exact))
+                if max_results > 0:
+                    if len(top) < max_results:
+                        heapq.heappush(top, total_score)
+                    else:
+                        heapq.heappushpop(top, total_score)
+                    if len(top) == max_results:
+                        cutoff = max(cutoff, top[0])
 
-        # Sort by score descending
-        results.sort(key=lambda r: r.total_score, reverse=True)
+        # Best max_results by score descending, keeping the store's order for ties
+        best = heapq.nsmallest(max_results, scored, key=lambda item: (-item[0], item[1]))
+
+        results: list[MatchResult] = []
+        for total_score, i, is_exact in best:
+            tx = cached_transactions[i]
+            signals = [
+                self._score_amount(extracted_amount, candidates.amounts[i]),
+                self._score_date(extracted_date, candidates.dates[i]),
+                self._score_description(extracted_description, tx.get("description", "")),
+                self._score_vendor(
+                    extracted_vendor, tx.get("destination_account") or tx.get("source_account")
+                ),
+            ]
+            reasons = [
+                f"{_REASON_LABELS[signal.signal]} ({signal.detail})"
+                for signal in signals
+                if signal.score > 0.5
+            ]
+            if is_exact:
+                reasons.append("EXACT_MATCH (amount+date+account)")
+            results.append(
+                MatchResult(
+                    firefly_id=tx["firefly_id"],
+                    document_id=document_id,
+                    total_score=total_score,
+                    signals=signals,
+                    reasons=reasons,
+                    is_exact_match=is_exact,
+                )
+            )
 
-        return results[:max_results]
+        return results
 
     def create_proposals(
         self,
@@ -229,17 +603,28 @@ class MatchingEngine:
             List of created proposal IDs.
         """
         matches = self.find_matches(document_id, extraction)
-        proposal_ids: list[int] = []
-
-        for match in matches:
-            proposal_id = self.store.create_match_proposal(
-                firefly_id=match.firefly_id,
-                document_id=match.document_id,
-                match_score=match.total_score,
-                match_reasons=match.reasons,
-            )
-            proposal_ids.append(proposal_id)
+        if not matches:
+            return []
+
+        # Auto-match if the threshold is exceeded OR it is an exact match
+        threshold = self.recon_config.auto_match_threshold
+        auto_matched = [match.total_score >= threshold or match.is_exact_match for match in matches]
+
+        # All proposals (and their auto-match statuses) are written in one go
+        proposal_ids = self.store.create_match_proposals(
+            [
+                {
+                    "firefly_id": match.firefly_id,
+                    "document_id": match.document_id,
+                    "match_score": match.total_score,
+                    "match_reasons": match.reasons,
+                    "status": "AUTO_MATCHED" if auto else "PENDING",
+                }
+                for match, auto in zip(matches, auto_matched, strict=True)
+            ]
+        )
 
+        for proposal_id, match, auto in zip(proposal_ids, matches, auto_matched, strict=True):
             logger.info(
                 "Created match proposal %d: doc %d -> tx %d (score: %.2f)",
                 proposal_id,
@@ -247,29 +632,34 @@ class MatchingEngine:
                 match.firefly_id,
                 match.total_score,
             )
-
-            # If auto-match threshold exceeded OR exact match, update status
-            if match.total_score >= self.recon_config.auto_match_threshold or match.is_exact_match:
-                if match.is_exact_match:
-                    logger.info(
-                        "Match proposal %d is EXACT MATCH (amount+date+account) - auto-matching",
-                        proposal_id,
-                    )
-                else:
-                    logger.info(
-                        "Match proposal %d exceeds auto-match threshold (%.2f >= %.2f)",
-                        proposal_id,
-                        match.total_score,
-                        self.recon_config.auto_match_threshold,
-                    )
-                self.store.update_proposal_status(proposal_id, "AUTO_MATCHED")
-                self.store.update_firefly_match_status(
-                    match.firefly_id,
-                    status="MATCHED",
-                    document_id=document_id,
-                    confidence=match.total_score,
+            if not auto:
+                continue
+            if match.is_exact_match:
+                logger.info(
+                    "Match proposal %d is EXACT MATCH (amount+date+account) - auto-matching",
+                    proposal_id,
+                )
+            else:
+                logger.info(
+                    "Match proposal %d exceeds auto-match threshold (%.2f >= %.2f)",
+                    proposal_id,
+                    match.total_score,
+                    threshold,
                 )
 
+        matched = [
+            {
+                "firefly_id": match.firefly_id,
+                "status": "MATCHED",
+                "document_id": document_id,
+                "confidence": match.total_score,
+            }
+            for match, auto in zip(matches, auto_matched, strict=True)
+            if auto
+        ]
+        if matched:
+            self.store.update_firefly_match_statuses(matched)
+
         return proposal_ids
 
     def _score_amount(
@@ -286,62 +676,12 @@ class MatchingEngine:
         Returns:
             MatchScore for amount signal.
         """
-        if extracted is None or transaction is None:
-            return MatchScore(
-                signal="amount",
-                score=0.0,
-                weight=self.WEIGHT_AMOUNT,
-                detail="missing",
-            )
-
-        # Exact match
-        if extracted == transaction:
-            return MatchScore(
-                signal="amount",
-                score=1.0,
-                weight=self.WEIGHT_AMOUNT,
-                detail=f"exact: {extracted}",
-            )
-
-        # Within 1% tolerance
-        if transaction != 0:
-            diff_pct = abs((extracted - transaction) / transaction)
-            if diff_pct <= 0.01:
-                return MatchScore(
-                    signal="amount",
-                    score=0.95,
-                    weight=self.WEIGHT_AMOUNT,
-                    detail=f"~1%: {extracted} vs {transaction}",
-                )
-            if diff_pct <= 0.05:
-                return MatchScore(
-                    signal="amount",
-                    score=0.7,
-                    weight=self.WEIGHT_AMOUNT,
-                    detail=f"~5%: {extracted} vs {transaction}",
-                )
-            # Within 10% tolerance - still useful for manual review
-            if diff_pct <= 0.10:
-                return MatchScore(
-                    signal="amount",
-                    score=0.4,
-                    weight=self.WEIGHT_AMOUNT,
-                    detail=f"~10%: {extracted} vs {transaction}",
-                )
-            # Within 20% - could be rounding differences or fees
-            if diff_pct <= 0.20:
-                return MatchScore(
-                    signal="amount",
-                    score=0.2,
-                    weight=self.WEIGHT_AMOUNT,
-                    detail=f"~20%: {extracted} vs {transaction}",
-                )
-
+        score, detail = _amount_score(_to_units(extracted), _to_units(transaction))
         return MatchScore(
             signal="amount",
-            score=0.0,
+            score=score,
             weight=self.WEIGHT_AMOUNT,
-            detail=f"mismatch: {extracted} vs {transaction}",
+            detail=detail.format(extracted=extracted, transaction=transaction),
         )
 
     def _score_date(
@@ -358,58 +698,17 @@ class MatchingEngine:
         Returns:
             MatchScore for date signal.
         """
-        if extracted is None or transaction is None:
-            return MatchScore(
-                signal="date",
-                score=0.0,
-                weight=self.WEIGHT_DATE,
-                detail="missing",
-            )
-
-        days_diff = abs((extracted.date() - transaction.date()).days)
+        days_diff = None
+        if extracted is not None and transaction is not None:
+            days_diff = abs((extracted.date() - transaction.date()).days)
         tolerance = self.recon_config.date_tolerance_days
 
-        if days_diff == 0:
-            return MatchScore(
-                signal="date",
-                score=1.0,
-                weight=self.WEIGHT_DATE,
-                detail="same day",
-            )
-
-        if days_diff <= tolerance:
-            # Linear decay within tolerance
-            score = 1.0 - (days_diff / (tolerance + 1))
-            return MatchScore(
-                signal="date",
-                score=max(score, 0.3),
-                weight=self.WEIGHT_DATE,
-                detail=f"{days_diff} days",
-            )
-
-        # Beyond tolerance but within 2x tolerance - still show as possibility
-        if days_diff <= tolerance * 2:
-            return MatchScore(
-                signal="date",
-                score=0.2,
-                weight=self.WEIGHT_DATE,
-                detail=f"{days_diff} days (extended)",
-            )
-
-        # Up to 30 days - could be month end processing
-        if days_diff <= 30:
-            return MatchScore(
-                signal="date",
-                score=0.1,
-                weight=self.WEIGHT_DATE,
-                detail=f"{days_diff} days (month)",
-            )
-
+        score, detail = _date_score(days_diff, tolerance)
         return MatchScore(
             signal="date",
-            score=0.0,
+            score=score,
             weight=self.WEIGHT_DATE,
-            detail=f">{tolerance} days",
+            detail=detail.format(days=days_diff, tolerance=tolerance),
         )
 
     def _score_description(
@@ -426,56 +725,14 @@ class MatchingEngine:
         Returns:
             MatchScore for description signal.
         """
-        if not extracted or not transaction:
-            return MatchScore(
-                signal="description",
-                score=0.0,
-                weight=self.WEIGHT_DESCRIPTION,
-                detail="missing",
-            )
-
-        # Normalize strings
-        ext_lower = extracted.lower().strip()
-        tx_lower = transaction.lower().strip()
-
-        # Exact match
-        if ext_lower == tx_lower:
-            return MatchScore(
-                signal="description",
-                score=1.0,
-                weight=self.WEIGHT_DESCRIPTION,
-                detail="exact",
-            )
-
-        # Contains check
-        if ext_lower in tx_lower or tx_lower in ext_lower:
-            return MatchScore(
-                signal="description",
-                score=0.8,
-                weight=self.WEIGHT_DESCRIPTION,
-                detail="contains",
-            )
-
-        # Word overlap (simple Jaccard-like)
-        ext_words = set(ext_lower.split())
-        tx_words = set(tx_lower.split())
-        if ext_words and tx_words:
-            intersection = ext_words & tx_words
-            union = ext_words | tx_words
-            jaccard = len(intersection) / len(union)
-            if jaccard > 0.3:
-                return MatchScore(
-                    signal="description",
-                    score=jaccard,
-                    weight=self.WEIGHT_DESCRIPTION,
-                    detail=f"overlap: {len(intersection)} words",
-                )
-
+        ext_lower = _normalize(extracted)
+        tx_lower = _normalize(transaction)
+        score, detail = _description_score(ext_lower, tx_lower, _words(ext_lower), _words(tx_lower))
         return MatchScore(
             signal="description",
-            score=0.0,
+            score=score,
             weight=self.WEIGHT_DESCRIPTION,
-            detail="no match",
+            detail=detail,
         )
 
     def _score_vendor(
@@ -492,51 +749,12 @@ class MatchingEngine:
         Returns:
             MatchScore for vendor signal.
         """
-        if not extracted or not transaction:
-            return MatchScore(
-                signal="vendor",
-                score=0.0,
-                weight=self.WEIGHT_VENDOR,
-                detail="missing",
-            )
-
-        ext_lower = extracted.lower().strip()
-        tx_lower = transaction.lower().strip()
-
-        # Exact match
-        if ext_lower == tx_lower:
-            return MatchScore(
-                signal="vendor",
-                score=1.0,
-                weight=self.WEIGHT_VENDOR,
-                detail="exact",
-            )
-
-        # Contains check (handles "Amazon.com" vs "Amazon")
-        if ext_lower in tx_lower or tx_lower in ext_lower:
-            return MatchScore(
-                signal="vendor",
-                score=0.85,
-                weight=self.WEIGHT_VENDOR,
-                detail="contains",
-            )
-
-        # Check first significant word
-        ext_first = ext_lower.split()[0] if ext_lower else ""
-        tx_first = tx_lower.split()[0] if tx_lower else ""
-        if ext_first and tx_first and ext_first == tx_first:
-            return MatchScore(
-                signal="vendor",
-                score=0.6,
-                weight=self.WEIGHT_VENDOR,
-                detail="first word",
-            )
-
+        score, detail = _vendor_score(_normalize(extracted), _normalize(transaction))
         return MatchScore(
             signal="vendor",
-            score=0.0,
+            score=score,
             weight=self.WEIGHT_VENDOR,
-            detail="no match",
+            detail=detail,
         )
 
     def _is_exact_match(
@@ -571,9 +789,8 @@ class MatchingEngine:
             True if all exact match criteria are satisfied.
         """
         # Check amount (exact match required)
-        if extracted_amount is None or tx_amount is None:
-            return False
-        if extracted_amount != tx_amount:
+        extracted_units = _to_units(extracted_amount)
+        if extracted_units is None or extracted_units != _to_units(tx_amount):
             return False
             
         # Check date (same day, ignore time)
@@ -643,15 +860,9 @@ class MatchingEngine:
         if isinstance(value, datetime):
             return value
         try:
-            # Try common formats
-            for fmt in ["%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%d/%m/%Y", "%m/%d/%Y"]:
-                try:
-                    return datetime.strptime(value[:10], fmt[:10])
-                except ValueError:
-                    continue
+            return _parse_date_text(value)
         except Exception:
-            pass
-        return None
+            return None
 
     def score_candidate(
         self,
@@ -710,7 +921,12 @@ class MatchingEngine:
         if vendor_score.score > 0.5:
             reasons.append(f"vendor_match ({vendor_score.detail})")
 
-        total_score = sum(s.weighted_score for s in signals)
+        total_score = (
+            amount_score.score * self.WEIGHT_AMOUNT
+            + date_score.score * self.WEIGHT_DATE
+            + desc_score.score * self.WEIGHT_DESCRIPTION
+            + vendor_score.score * self.WEIGHT_VENDOR
+        )
 
         return MatchResult(
             firefly_id=candidate.get("firefly_id", 0),
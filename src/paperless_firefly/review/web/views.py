@@ -18,7 +18,7 @@ from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.shortcuts import redirect, render
 from django.views.decorators.http import require_http_methods, require_POST
 
-from ...firefly_client import FireflyClient
+from ...firefly_client import FireflyClient, FireflyTransaction
 from ...schemas.dedupe import generate_external_id
 from ...schemas.finance_extraction import FinanceExtraction
 from ...state_store import StateStore
@@ -3784,7 +3784,7 @@ def sync_firefly_transactions(request: HttpRequest) -> HttpResponse:
             # Store in cache and collect IDs for soft-delete check
             # Also track transactions that need external_id assignment
             synced = 0
-            need_external_id: list[tuple[int, str]] = []  # (firefly_id, computed_external_id)
+            need_external_id: list[FireflyTransaction] = []  # Lacking a stored external_id
             current_firefly_ids: set[int] = set()
 
             for tx in transactions:
@@ -3795,7 +3795,7 @@ def sync_firefly_transactions(request: HttpRequest) -> HttpResponse:
 
                 # Track transactions that need external_id assignment
                 if not tx.external_id and tx.computed_external_id:
-                    need_external_id.append((tx.id, tx.computed_external_id))
+                    need_external_id.append(tx)
 
                 store.upsert_firefly_cache(
                     firefly_id=tx.id,
@@ -3821,14 +3821,13 @@ def sync_firefly_transactions(request: HttpRequest) -> HttpResponse:
                 _firefly_sync_status["progress"] = (
                     f"Assigning external_id to {len(need_external_id)} transactions..."
                 )
-                for firefly_id, computed_id in need_external_id:
+                for tx in need_external_id:
                     try:
-                        if firefly.set_external_id(firefly_id, computed_id):
+                        # Passing the listed transaction avoids a GET per update
+                        if firefly.set_external_id(tx.id, tx.computed_external_id, existing=tx):
                             external_id_set += 1
                     except Exception as e:
-                        logger.warning(
-                            f"Failed to set external_id for transaction {firefly_id}: {e}"
-                        )
+                        logger.warning(f"Failed to set external_id for transaction {tx.id}: {e}")
 
             # Soft delete transactions that are no longer in Firefly
             _firefly_sync_status["progress"] = "Checking for deleted transactions..."
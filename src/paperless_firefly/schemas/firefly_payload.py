@@ -331,8 +331,9 @@ def validate_firefly_payload(payload: FireflyTransactionStore) -> list[str]:
         if i == 0 and not split.notes:
             errors.append(f"{prefix}.notes is required for audit trail")
 
-    # For multi-split, validate sum equals group total
-    if len(payload.transactions) > 1:
+    # For multi-split, log the group total. Only summed when it is logged and
+    # every amount parsed; validation runs before each create_transaction().
+    if len(payload.transactions) > 1 and not errors and logger.isEnabledFor(logging.DEBUG):
         total = sum(Decimal(t.amount) for t in payload.transactions)
         # Note: We trust the builder to handle rounding; this is a sanity check
         logger.debug(f"Multi-split transaction total: {total}")
@@ -217,6 +217,7 @@ class ReconciliationService:
         extractions = self._get_eligible_extractions()
         logger.debug("Found %d eligible extractions for matching", len(extractions))
 
+        jobs: list[tuple[int, dict]] = []
         for extraction in extractions:
             document_id = extraction["document_id"]
 
@@ -236,13 +237,24 @@ class ReconciliationService:
                 result.proposals_existing += 1
                 continue
 
-            # Find matches using the matching engine (filtered by user_id)
-            matches = self.matching_engine.find_matches(
-                document_id=document_id,
-                extraction=self._extraction_to_dict(extraction),
-                user_id=self.user_id,
-            )
+            jobs.append((document_id, self._extraction_to_dict(extraction)))
 
+        if not jobs:
+            return
+
+        # Find matches using the matching engine (filtered by user_id). Creating
+        # proposals does not change which transactions are unmatched, so all
+        # documents are matched against a single load of the cache.
+        batch_matches = self.matching_engine.find_matches_batch(jobs, user_id=self.user_id)
+
+        # document_id is not unique across extractions. Once one of a document's
+        # rows has created proposals, its later rows count as existing, as they
+        # would have via _has_pending_proposals() when matched one at a time.
+        proposed: set[int] = set()
+        for (document_id, _), matches in zip(jobs, batch_matches, strict=True):
+            if document_id in proposed:
+                result.proposals_existing += 1
+                continue
             if not matches:
                 continue
 
@@ -260,6 +272,7 @@ class ReconciliationService:
                 proposal_id = self._create_proposal(match)
                 if proposal_id:
                     result.proposals_created += 1
+                    proposed.add(document_id)
 
                     # Record interpretation run for proposal creation
                     self._record_interpretation_run(
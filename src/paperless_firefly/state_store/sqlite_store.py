@@ -1259,6 +1259,30 @@ class StateStore:
                 (status, document_id, confidence, firefly_id),
             )
 
+    def update_firefly_match_statuses(self, updates: list[dict[str, Any]]) -> None:
+        """Update match status for several cached Firefly transactions in one transaction.
+
+        Each update is a dict with the update_firefly_match_status() arguments:
+        firefly_id, status and optionally document_id and confidence.
+        """
+        with self._transaction() as conn:
+            conn.executemany(
+                """
+                UPDATE firefly_cache
+                SET match_status = ?, matched_document_id = ?, match_confidence = ?
+                WHERE firefly_id = ?
+            """,
+                [
+                    (
+                        update["status"],
+                        update.get("document_id"),
+                        update.get("confidence"),
+                        update["firefly_id"],
+                    )
+                    for update in updates
+                ],
+            )
+
     def get_firefly_cache_entry(
         self, firefly_id: int, user_id: int | None = None
     ) -> dict[str, Any] | None:
@@ -1375,6 +1399,40 @@ class StateStore:
             )
             return cursor.lastrowid or 0
 
+    def create_match_proposals(self, proposals: list[dict[str, Any]]) -> list[int]:
+        """Create several match proposals in one transaction. Returns the proposal IDs.
+
+        Each proposal is a dict with the create_match_proposal() arguments
+        (firefly_id, document_id, match_score, optional match_reasons) and an
+        optional status. Proposals created with a status other than PENDING
+        are stamped as reviewed at creation time.
+        """
+        now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+        proposal_ids: list[int] = []
+
+        with self._transaction() as conn:
+            for proposal in proposals:
+                status = proposal.get("status", "PENDING")
+                cursor = conn.execute(
+                    """
+                    INSERT INTO match_proposals
+                    (firefly_id, document_id, match_score, match_reasons, status,
+                     created_at, reviewed_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                    (
+                        proposal["firefly_id"],
+                        proposal["document_id"],
+                        proposal["match_score"],
+                        json.dumps(proposal.get("match_reasons") or []),
+                        status,
+                        now,
+                        None if status == "PENDING" else now,
+                    ),
+                )
+                proposal_ids.append(cursor.lastrowid or 0)
+        return proposal_ids
+
     def get_pending_proposals(self) -> list[dict[str, Any]]:
         """Get all pending match proposals."""
         with self._transaction() as conn:
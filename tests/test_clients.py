@@ -412,6 +412,188 @@ class TestFireflyClient:
 
         assert result is None
 
+    @responses.activate
+    def test_find_by_external_id_caches_misses(self):
+        """Repeated lookups of a missing external_id search only once."""
+        responses.add(
+            responses.GET,
+            f"{self.BASE_URL}/api/v1/search/transactions",
+            json={"data": [], "meta": {"pagination": {"total": 0}}},
+            status=200,
+        )
+
+        client = FireflyClient(self.BASE_URL, self.TOKEN)
+        assert client.find_by_external_id("nonexistent:id") is None
+        assert client.find_by_external_id("nonexistent:id") is None
+        assert len(responses.calls) == 1
+
+        client.clear_dedup_cache()
+        assert client.find_by_external_id("nonexistent:id") is None
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_create_transaction_remembers_external_ids(self):
+        """Created external IDs resolve as duplicates without another search."""
+        import json
+
+        responses.add(
+            responses.GET,
+            f"{self.BASE_URL}/api/v1/search/transactions",
+            json={"data": [], "meta": {"pagination": {"total": 0}}},
+            status=200,
+        )
+        responses.add(
+            responses.POST,
+            f"{self.BASE_URL}/api/v1/transactions",
+            json={"data": {"id": "12345"}},
+            status=200,
+        )
+
+        client = FireflyClient(self.BASE_URL, self.TOKEN)
+        tx = FireflyTransactionSplit(
+            type="withdrawal",
+            date="2024-11-18",
+            amount="11.48",
+            description="SPAR Purchase",
+            source_name="Checking Account",
+            destination_name="SPAR",
+            external_id="paperless:7:abc:11.48:2024-11-18",
+            notes="paperless_document_id=7, source_hash=abc",
+        )
+        payload = FireflyTransactionStore(transactions=[tx])
+
+        assert client.create_transaction(payload) == 12345
+        assert client.create_transaction(payload) == 12345
+        assert [call.request.method for call in responses.calls] == ["GET", "POST"]
+
+        # After clearing, the next check searches again
+        client.clear_dedup_cache()
+        client.create_transaction(payload)
+        assert [call.request.method for call in responses.calls][2] == "GET"
+
+        # Pre-deduplicated callers can skip the lookup altogether
+        client.clear_dedup_cache()
+        client.create_transaction(payload, skip_duplicate_check=True)
+        assert [call.request.method for call in responses.calls][4:] == ["POST"]
+        # ...but Firefly's duplicate-hash check is still requested
+        body = json.loads(responses.calls[4].request.body)
+        assert body["error_if_duplicate_hash"] is True
+
+    @responses.activate
+    def test_create_transaction_creation_first(self):
+        """Without the pre-flight search, a duplicate 422 is resolved by one lookup."""
+        import json
+
+        external_id = "paperless:8:abc:11.48:2024-11-18"
+        responses.add(
+            responses.POST,
+            f"{self.BASE_URL}/api/v1/transactions",
+            json={"data": {"id": "12345"}},
+            status=200,
+        )
+        responses.add(
+            responses.POST,
+            f"{self.BASE_URL}/api/v1/transactions",
+            json={
+                "message": "The given data was invalid.",
+                "errors": {"transactions.0.description": ["Duplicate of transaction #77."]},
+            },
+            status=422,
+        )
+        responses.add(
+            responses.GET,
+            f"{self.BASE_URL}/api/v1/search/transactions",
+            json={
+                "data": [
+                    {
+                        "id": "77",
+                        "attributes": {"transactions": [{"external_id": external_id}]},
+                    }
+                ]
+            },
+            status=200,
+        )
+
+        client = FireflyClient(self.BASE_URL, self.TOKEN)
+        tx = FireflyTransactionSplit(
+            type="withdrawal",
+            date="2024-11-18",
+            amount="11.48",
+            description="SPAR Purchase",
+            source_name="Checking Account",
+            destination_name="SPAR",
+            external_id=external_id,
+            notes="paperless_document_id=8, source_hash=abc",
+        )
+        payload = FireflyTransactionStore(transactions=[tx])
+
+        assert client.create_transaction(payload, skip_duplicate_check=True) == 12345
+        assert [call.request.method for call in responses.calls] == ["POST"]
+        body = json.loads(responses.calls[0].request.body)
+        assert body["error_if_duplicate_hash"] is True
+        assert payload.error_if_duplicate_hash is False
+
+        client.clear_dedup_cache()
+        assert client.create_transaction(payload, skip_duplicate_check=True) == 77
+        assert [call.request.method for call in responses.calls][1:] == ["POST", "GET"]
+
+    @responses.activate
+    def test_find_by_external_ids(self):
+        """Batch lookup returns hits by external_id and caches the misses."""
+        import json
+
+        def search(request):
+            query = request.params["query"]
+            # Colons in the ID are quoted so the search parser keeps it whole
+            if query != 'external_id:"found:id"':
+                return (200, {}, json.dumps({"data": []}))
+            body = {
+                "data": [
+                    {
+                        "id": "42",
+                        "attributes": {
+                            "transactions": [
+                                {
+                                    "type": "withdrawal",
+                                    "amount": "5.00",
+                                    "external_id": "found:id",
+                                    "transaction_journal_id": "420",
+                                }
+                            ]
+                        },
+                    }
+                ]
+            }
+            return (200, {}, json.dumps(body))
+
+        responses.add_callback(
+            responses.GET, f"{self.BASE_URL}/api/v1/search/transactions", callback=search
+        )
+
+        client = FireflyClient(self.BASE_URL, self.TOKEN)
+        found = client.find_by_external_ids(["found:id", "missing:id", "found:id"])
+
+        assert list(found) == ["found:id"]
+        assert found["found:id"].id == 42
+        assert found["found:id"].transaction_journal_id == 420
+        assert len(responses.calls) == 2
+
+        # The miss is cached, and a preloaded map skips the search entirely
+        assert client.find_by_external_id("missing:id") is None
+        tx = FireflyTransactionSplit(
+            type="withdrawal",
+            date="2024-11-18",
+            amount="5.00",
+            description="Lookup",
+            source_name="Checking Account",
+            destination_name="Shop",
+            external_id="found:id",
+            notes="paperless_document_id=1, source_hash=abc",
+        )
+        payload = FireflyTransactionStore(transactions=[tx])
+        assert client.create_transaction(payload, existing=found) == 42
+        assert len(responses.calls) == 2
+
     @responses.activate
     def test_create_transaction_success(self):
         """Test creating a new transaction."""
@@ -464,6 +646,115 @@ class TestFireflyClient:
 
         assert result == 12345
 
+    @responses.activate
+    def test_create_transaction_uses_prefetched_external_ids(self):
+        """Prefetched external IDs replace per-transaction searches in the window."""
+        responses.add(
+            responses.GET,
+            f"{self.BASE_URL}/api/v1/transactions",
+            json={
+                "data": [
+                    {
+                        "id": "999",
+                        "attributes": {
+                            "transactions": [
+                                {
+                                    "type": "withdrawal",
+                                    "date": "2024-11-18T00:00:00+00:00",
+                                    "amount": "11.48",
+                                    "external_id": "paperless:1:abc:11.48:2024-11-18",
+                                }
+                            ]
+                        },
+                    }
+                ],
+                "meta": {"pagination": {"total_pages": 1}},
+            },
+            status=200,
+        )
+        responses.add(
+            responses.POST,
+            f"{self.BASE_URL}/api/v1/transactions",
+            json={"data": {"id": "12345"}},
+            status=200,
+        )
+
+        client = FireflyClient(self.BASE_URL, self.TOKEN)
+        known = client.prefetch_external_ids("2024-11-01", "2024-11-30")
+        assert known == {"paperless:1:abc:11.48:2024-11-18": 999}
+
+        def make_payload(external_id: str) -> FireflyTransactionStore:
+            return FireflyTransactionStore(
+                transactions=[
+                    FireflyTransactionSplit(
+                        type="withdrawal",
+                        date="2024-11-18",
+                        amount="11.48",
+                        description="SPAR Purchase",
+                        source_name="Checking Account",
+                        destination_name="SPAR",
+                        external_id=external_id,
+                        notes="paperless_document_id=1, source_hash=abc",
+                    )
+                ]
+            )
+
+        assert client.create_transaction(make_payload("paperless:1:abc:11.48:2024-11-18")) == 999
+        assert client.create_transaction(make_payload("paperless:2:def:11.48:2024-11-18")) == 12345
+        # A retry of the new transaction is now a known duplicate
+        assert client.create_transaction(make_payload("paperless:2:def:11.48:2024-11-18")) == 12345
+
+        # One list request and one POST; no search requests
+        assert [call.request.method for call in responses.calls] == ["GET", "POST"]
+
+    @responses.activate
+    def test_create_transactions_bulk(self):
+        """Bulk creation prefetches once and resolves in-batch repeats as duplicates."""
+        responses.add(
+            responses.GET,
+            f"{self.BASE_URL}/api/v1/transactions",
+            json={"data": [], "meta": {"pagination": {"total_pages": 1}}},
+            status=200,
+        )
+        responses.add(
+            responses.POST,
+            f"{self.BASE_URL}/api/v1/transactions",
+            json={"data": {"id": "12345"}},
+            status=200,
+        )
+
+        def make_payload(external_id: str, date: str) -> FireflyTransactionStore:
+            return FireflyTransactionStore(
+                transactions=[
+                    FireflyTransactionSplit(
+                        type="withdrawal",
+                        date=date,
+                        amount="11.48",
+                        description="SPAR Purchase",
+                        source_name="Checking Account",
+                        destination_name="SPAR",
+                        external_id=external_id,
+                        notes="paperless_document_id=1, source_hash=abc",
+                    )
+                ]
+            )
+
+        client = FireflyClient(self.BASE_URL, self.TOKEN)
+        results = client.create_transactions_bulk(
+            [
+                make_payload("paperless:1:abc:11.48:2024-11-18", "2024-11-18"),
+                make_payload("paperless:1:abc:11.48:2024-11-18", "2024-11-18"),
+                make_payload("paperless:2:def:11.48:2024-11-20", "2024-11-20"),
+            ]
+        )
+
+        assert results == [12345, 12345, 12345]
+        methods = [call.request.method for call in responses.calls]
+        assert methods.count("GET") == 1
+        assert methods.count("POST") == 2
+        assert "start=2024-11-18" in responses.calls[0].request.url
+        assert "end=2024-11-20" in responses.calls[0].request.url
+
     @responses.activate
     def test_create_transaction_skips_duplicate(self):
         """Test creating transaction with duplicate external_id is skipped."""
@@ -512,6 +803,45 @@ class TestFireflyClient:
         result = client.create_transaction(payload)
         assert result == 999
 
+    @responses.activate
+    def test_create_transaction_firefly_duplicate_hash(self):
+        """A 422 duplicate-hash rejection is skipped; other 422s are raised."""
+        from paperless_firefly.firefly_client.client import FireflyAPIError
+
+        responses.add(
+            responses.POST,
+            f"{self.BASE_URL}/api/v1/transactions",
+            json={
+                "message": "The given data was invalid.",
+                "errors": {"transactions.0.description": ["Duplicate of transaction #5."]},
+            },
+            status=422,
+        )
+        responses.add(
+            responses.POST,
+            f"{self.BASE_URL}/api/v1/transactions",
+            json={"message": "Invalid", "errors": {"duplicate_hash_field": ["Is required"]}},
+            status=422,
+        )
+
+        client = FireflyClient(self.BASE_URL, self.TOKEN)
+        tx = FireflyTransactionSplit(
+            type="withdrawal",
+            date="2024-11-18",
+            amount="11.48",
+            description="SPAR Purchase",
+            source_name="Checking Account",
+            destination_name="SPAR",
+            external_id="paperless:123:abc:11.48:2024-11-18",
+            notes="paperless_document_id=123",
+        )
+        payload = FireflyTransactionStore(transactions=[tx])
+
+        assert client.create_transaction(payload, existing={}) is None
+        # Only messages are checked, not field names
+        with pytest.raises(FireflyAPIError):
+            client.create_transaction(payload, existing={})
+
     @responses.activate
     def test_list_accounts(self):
         """Test listing accounts."""
@@ -722,70 +1052,943 @@ class TestPaperlessClientPagination:
         assert [d.id for d in docs] == [1, 2, 3]
 
 
-class TestClientErrorHandling:
-    """Test error handling in clients."""
+class TestFireflyClientPagination:
+    """Test pagination handling in Firefly client."""
 
-    @responses.activate
-    def test_paperless_api_error(self):
-        """Test handling of API errors."""
-        from paperless_firefly.paperless_client.client import PaperlessAPIError
+    BASE_URL = "http://firefly.test:8080"
+    TOKEN = "firefly-token"
 
+    def _add_bill_page(self, page: int, total_pages: int, bill_ids: list[int]) -> None:
         responses.add(
             responses.GET,
-            "http://paperless.test:8000/api/documents/1/",
-            json={"detail": "Not found."},
-            status=404,
+            f"{self.BASE_URL}/api/v1/bills",
+            match=[responses.matchers.query_param_matcher({"page": str(page)})],
+            json={
+                "data": [{"id": str(i), "attributes": {"name": f"Bill {i}"}} for i in bill_ids],
+                "meta": {"pagination": {"total_pages": total_pages}},
+            },
+            status=200,
         )
 
-        client = PaperlessClient("http://paperless.test:8000", "token")
+    @responses.activate
+    def test_iter_bills_follows_pages(self):
+        """iter_bills yields items from every page in order."""
+        self._add_bill_page(1, 2, [1, 2])
+        self._add_bill_page(2, 2, [3])
 
-        with pytest.raises(PaperlessAPIError) as exc_info:
-            client.get_document(1)
+        client = FireflyClient(self.BASE_URL, self.TOKEN)
+        bills = list(client.iter_bills())
 
-        assert exc_info.value.status_code == 404
+        assert [b["id"] for b in bills] == [1, 2, 3]
+        assert bills[2]["name"] == "Bill 3"
 
     @responses.activate
-    def test_firefly_validation_error(self):
-        """Test handling of validation errors from Firefly."""
-        from paperless_firefly.firefly_client.client import FireflyAPIError
+    def test_iter_bills_is_lazy(self):
+        """iter_bills does not fetch later pages until they are consumed."""
+        self._add_bill_page(1, 2, [1, 2])
+        self._add_bill_page(2, 2, [3])
 
-        # Mock find_by_external_id to return no existing transaction
-        responses.add(
-            responses.GET,
-            "http://firefly.test:8080/api/v1/search/transactions",
-            json={"data": [], "meta": {"pagination": {"total": 0}}},
-            status=200,
-        )
+        client = FireflyClient(self.BASE_URL, self.TOKEN)
+        first = next(client.iter_bills())
 
-        responses.add(
-            responses.POST,
-            "http://firefly.test:8080/api/v1/transactions",
-            json={
-                "message": "The given data was invalid.",
-                "errors": {
-                    "transactions.0.amount": ["Amount is required"],
-                    "transactions.0.date": ["Date format invalid"],
+        assert first["id"] == 1
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_list_bills_matches_iter_bills(self):
+        """list_bills returns the materialized iterator."""
+        self._add_bill_page(1, 2, [1, 2])
+        self._add_bill_page(2, 2, [3])
+
+        client = FireflyClient(self.BASE_URL, self.TOKEN)
+
+        assert [b["id"] for b in client.list_bills()] == [1, 2, 3]
+
+    @responses.activate
+    def test_iter_transactions_streams_pages(self):
+        """iter_transactions yields page 1 before requesting page 2."""
+        for page in (1, 2):
+            responses.add(
+                responses.GET,
+                f"{self.BASE_URL}/api/v1/transactions",
+                match=[
+                    responses.matchers.query_param_matcher(
+                        {"start": "2024-11-01", "end": "2024-11-30", "page": str(page)}
+                    )
+                ],
+                json={
+                    "data": [
+                        {
+                            "id": str(page),
+                            "attributes": {
+                                "transactions": [
+                                    {"type": "withdrawal", "date": "", "amount": "1.00"}
+                                ]
+                            },
+                        }
+                    ],
+                    "meta": {"pagination": {"total_pages": 2}},
                 },
-            },
-            status=422,
-        )
+                status=200,
+            )
 
-        client = FireflyClient("http://firefly.test:8080", "token")
+        client = FireflyClient(self.BASE_URL, self.TOKEN)
+        transactions = client.iter_transactions("2024-11-01", "2024-11-30")
 
-        tx = FireflyTransactionSplit(
-            type="withdrawal",
-            date="2024-11-18",
-            amount="10.00",
-            description="Test",
-            external_id="test:123",
-            notes="paperless_document_id=123",
-        )
-        payload = FireflyTransactionStore(transactions=[tx])
+        assert next(transactions).id == 1
+        assert len(responses.calls) == 1
+        assert [tx.id for tx in transactions] == [2]
 
-        with pytest.raises(FireflyAPIError) as exc_info:
-            client.create_transaction(payload)
+    @responses.activate
+    def test_list_categories_fetches_pages_concurrently_in_order(self):
+        """list_categories fetches pages 2..N in parallel but keeps page order."""
+        for page in range(1, 5):
+            responses.add(
+                responses.GET,
+                f"{self.BASE_URL}/api/v1/categories",
+                match=[responses.matchers.query_param_matcher({"page": str(page)})],
+                json={
+                    "data": [{"id": str(page), "attributes": {"name": f"Category {page}"}}],
+                    "meta": {"pagination": {"total_pages": 4}},
+                },
+                status=200,
+            )
 
-        assert exc_info.value.status_code == 422
+        client = FireflyClient(self.BASE_URL, self.TOKEN)
+        categories = client.list_categories()
+
+        assert [c.id for c in categories] == [1, 2, 3, 4]
+        assert len(responses.calls) == 4
+
+    @responses.activate
+    def test_list_accounts_respects_max_pages(self):
+        """list_accounts stops at max_pages even when more pages exist."""
+        for page in range(1, 4):
+            responses.add(
+                responses.GET,
+                f"{self.BASE_URL}/api/v1/accounts",
+                match=[
+                    responses.matchers.query_param_matcher({"type": "asset", "page": str(page)})
+                ],
+                json={
+                    "data": [{"id": str(page), "attributes": {"name": f"Account {page}"}}],
+                    "meta": {"pagination": {"total_pages": 3}},
+                },
+                status=200,
+            )
+
+        client = FireflyClient(self.BASE_URL, self.TOKEN)
+        accounts = client.list_accounts(max_pages=2)
+
+        assert [a["id"] for a in accounts] == ["1", "2"]
+        assert len(responses.calls) == 2
+
+
+class TestFireflyJsonBackend:
+    """Test JSON encoding/decoding with and without orjson."""
+
+    BASE_URL = "http://firefly.test:8080"
+
+    @pytest.mark.parametrize("has_orjson", [True, False])
+    @responses.activate
+    def test_request_round_trip(self, monkeypatch, has_orjson):
+        """Request bodies and responses are JSON regardless of the backend."""
+        import json
+
+        from paperless_firefly.firefly_client import client as client_module
+
+        if has_orjson and not client_module.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(client_module, "HAS_ORJSON", has_orjson)
+
+        responses.add(
+            responses.POST,
+            f"{self.BASE_URL}/api/v1/tags",
+            json={"data": {"id": "7"}},
+            status=200,
+        )
+
+        client = FireflyClient(self.BASE_URL, "token")
+
+        assert client.create_tag("groceries", "Food") == 7
+        request = responses.calls[0].request
+        assert json.loads(request.body) == {"tag": "groceries", "description": "Food"}
+        assert request.headers["Content-Type"] == "application/json"
+
+    @pytest.mark.parametrize("has_simdjson", [True, False])
+    @responses.activate
+    def test_list_transactions_lazy_parsing(self, monkeypatch, has_simdjson):
+        """list_transactions aggregates splits identically with lazy parsing."""
+        from paperless_firefly.firefly_client import client as client_module
+
+        if has_simdjson and not client_module.HAS_SIMDJSON:
+            pytest.skip("pysimdjson not installed")
+        monkeypatch.setattr(client_module, "HAS_SIMDJSON", has_simdjson)
+
+        responses.add(
+            responses.GET,
+            f"{self.BASE_URL}/api/v1/transactions",
+            json={
+                "data": [
+                    {
+                        "id": "42",
+                        "attributes": {
+                            "transactions": [
+                                {
+                                    "type": "withdrawal",
+                                    "date": "2024-11-18T00:00:00+00:00",
+                                    "amount": "10.00",
+                                    "description": "SPAR",
+                                    "source_name": "Checking",
+                                    "destination_name": "SPAR",
+                                    "tags": ["food", {"tag": "weekly"}],
+                                },
+                                {
+                                    "type": "withdrawal",
+                                    "date": "2024-11-18T00:00:00+00:00",
+                                    "amount": "1.48",
+                                    "description": "Deposit",
+                                    "tags": ["food"],
+                                },
+                            ]
+                        },
+                    }
+                ],
+                "meta": {"pagination": {"total_pages": 1}},
+            },
+            status=200,
+        )
+
+        client = FireflyClient(self.BASE_URL, "token")
+        transactions = client.list_transactions("2024-11-01", "2024-11-30")
+
+        assert len(transactions) == 1
+        tx = transactions[0]
+        assert tx.id == 42
+        assert tx.amount == "11.48"
+        assert tx.split_count == 2
+        assert tx.tags == ["food", "weekly"]
+        assert tx.source_name == "Checking"
+
+    @responses.activate
+    def test_list_transactions_sums_splits_exactly(self):
+        """Split amounts are summed without binary float drift."""
+        responses.add(
+            responses.GET,
+            f"{self.BASE_URL}/api/v1/transactions",
+            json={
+                "data": [
+                    {
+                        "id": "43",
+                        "attributes": {
+                            "transactions": [
+                                {"type": "withdrawal", "amount": "0.100000000000", "date": ""},
+                                {"type": "withdrawal", "amount": "0.200000000000", "date": ""},
+                            ]
+                        },
+                    }
+                ],
+                "meta": {"pagination": {"total_pages": 1}},
+            },
+            status=200,
+        )
+
+        client = FireflyClient(self.BASE_URL, "token")
+        transactions = client.list_transactions("2024-11-01", "2024-11-30")
+
+        assert transactions[0].amount == "0.3"
+
+
+class TestFireflyTransactionCache:
+    """Test reuse of fetched transaction groups across linkage updates."""
+
+    BASE_URL = "http://firefly.test:8080"
+    TOKEN = "firefly-token"
+
+    def _add_transaction(self, transaction_id: int, external_id: str | None = None) -> None:
+        responses.add(
+            responses.GET,
+            f"{self.BASE_URL}/api/v1/transactions/{transaction_id}",
+            json={
+                "data": {
+                    "id": str(transaction_id),
+                    "attributes": {
+                        "transactions": [
+                            {
+                                "transaction_journal_id": "77",
+                                "type": "withdrawal",
+                                "date": "2024-11-18T00:00:00+00:00",
+                                "amount": "11.48",
+                                "description": "SPAR",
+                                "external_id": external_id,
+                            }
+                        ]
+                    },
+                }
+            },
+            status=200,
+        )
+
+    @responses.activate
+    def test_cached_transaction_skips_second_get(self):
+        """A cached transaction group is not fetched again."""
+        self._add_transaction(5, external_id="existing")
+
+        client = FireflyClient(self.BASE_URL, self.TOKEN)
+
+        assert client.set_external_id(5, "abc") is False
+        assert client.set_external_id(5, "abc") is False
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_put_invalidates_cached_transaction(self):
+        """Updating a transaction drops it from the cache."""
+        self._add_transaction(5)
+        responses.add(
+            responses.PUT,
+            f"{self.BASE_URL}/api/v1/transactions/5",
+            json={"data": {"id": "5"}},
+            status=200,
+        )
+
+        client = FireflyClient(self.BASE_URL, self.TOKEN)
+        client._prefetch_transactions([5])
+
+        assert 5 in client._tx_cache
+        assert client.set_external_id(5, "abc") is True
+        assert 5 not in client._tx_cache
+        assert [c.request.method for c in responses.calls] == ["GET", "PUT"]
+
+    @responses.activate
+    def test_get_transaction_fills_cache(self):
+        """A transaction read with get_transaction() is not fetched again for an update."""
+        self._add_transaction(5)
+        responses.add(
+            responses.PUT,
+            f"{self.BASE_URL}/api/v1/transactions/5",
+            json={"data": {"id": "5"}},
+            status=200,
+        )
+
+        client = FireflyClient(self.BASE_URL, self.TOKEN)
+        tx = client.get_transaction(5)
+
+        assert tx.transaction_journal_id == 77
+        assert client.update_transaction_linkage(5, "abc", "ref", "linked") is True
+        assert [c.request.method for c in responses.calls] == ["GET", "PUT"]
+
+        # get_transaction() itself never serves a cached group
+        client._prefetch_transactions([5])
+        client.get_transaction(5)
+        assert [c.request.method for c in responses.calls][2:] == ["GET", "GET"]
+
+    @responses.activate
+    def test_single_split_update_is_partial_put(self):
+        """A known single-split transaction is updated without a GET."""
+        import json
+
+        self._add_transaction(5)
+        responses.add(
+            responses.PUT,
+            f"{self.BASE_URL}/api/v1/transactions/5",
+            json={"data": {"id": "5"}},
+            status=200,
+        )
+
+        client = FireflyClient(self.BASE_URL, self.TOKEN)
+        existing = client.get_transaction(5)
+        assert existing.transaction_journal_id == 77
+
+        assert client.update_transaction_linkage(5, "abc", "PAPERLESS:1", "doc 1", existing)
+
+        assert [c.request.method for c in responses.calls] == ["GET", "PUT"]
+        body = json.loads(responses.calls[1].request.body)
+        assert body == {
+            "transactions": [
+                {
+                    "transaction_journal_id": 77,
+                    "external_id": "abc",
+                    "internal_reference": "PAPERLESS:1",
+                    "notes": "doc 1",
+                }
+            ]
+        }
+
+    @responses.activate
+    def test_multi_split_update_sends_all_splits(self):
+        """Multi-split groups always send the full split list back."""
+        import json
+
+        from paperless_firefly.firefly_client import FireflyTransaction
+
+        self._add_transaction(5)
+        responses.add(
+            responses.PUT,
+            f"{self.BASE_URL}/api/v1/transactions/5",
+            json={"data": {"id": "5"}},
+            status=200,
+        )
+        existing = FireflyTransaction(
+            id=5,
+            type="withdrawal",
+            date="2024-11-18",
+            amount="11.48",
+            description="SPAR",
+            split_count=2,
+            has_splits=True,
+            transaction_journal_id=77,
+        )
+
+        client = FireflyClient(self.BASE_URL, self.TOKEN)
+
+        assert client.set_external_id(5, "abc", existing=existing) is True
+        assert [c.request.method for c in responses.calls] == ["GET", "PUT"]
+        split = json.loads(responses.calls[1].request.body)["transactions"][0]
+        assert split["external_id"] == "abc"
+        assert split["description"] == "SPAR"
+
+
+class TestFireflyNameCache:
+    """Test the cached account/category name indexes."""
+
+    BASE_URL = "http://firefly.test:8080"
+    TOKEN = "firefly-token"
+
+    def _add_accounts(self, names: list[str]) -> None:
+        responses.add(
+            responses.GET,
+            f"{self.BASE_URL}/api/v1/accounts",
+            json={
+                "data": [
+                    {"id": str(i), "attributes": {"name": name, "type": "expense"}}
+                    for i, name in enumerate(names, start=1)
+                ],
+                "meta": {"pagination": {"total_pages": 1}},
+            },
+            status=200,
+        )
+
+    @responses.activate
+    def test_find_or_create_account_reuses_index(self):
+        """Repeated lookups of known accounts only list accounts once."""
+        self._add_accounts(["SPAR", "Amazon", "Bäckerei Straße"])
+
+        client = FireflyClient(self.BASE_URL, self.TOKEN)
+
+        assert client.find_or_create_account("spar") == 1
+        assert client.find_or_create_account("AMAZON") == 2
+        # Names are casefolded, so "ß" matches "SS"
+        assert client.find_or_create_account("BÄCKEREI STRASSE") == 3
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_created_account_is_added_to_index(self):
+        """A newly created account is found again without refetching."""
+        self._add_accounts(["SPAR"])
+        responses.add(
+            responses.POST,
+            f"{self.BASE_URL}/api/v1/accounts",
+            json={"data": {"id": "9"}},
+            status=200,
+        )
+
+        client = FireflyClient(self.BASE_URL, self.TOKEN)
+
+        assert client.find_or_create_account("Billa") == 9
+        assert client.find_or_create_account("billa") == 9
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_invalidate_accounts_cache_forces_refetch(self):
+        """invalidate_accounts_cache() drops the index."""
+        self._add_accounts(["SPAR"])
+
+        client = FireflyClient(self.BASE_URL, self.TOKEN)
+        client.find_or_create_account("SPAR")
+        client.invalidate_accounts_cache()
+        client.find_or_create_account("SPAR")
+
+        assert len(responses.calls) == 2
+
+        # Dropping another type's index leaves this one cached
+        client.invalidate_accounts_cache("revenue")
+        client.find_or_create_account("SPAR")
+        assert len(responses.calls) == 2
+
+        client.invalidate_accounts_cache("expense")
+        client.find_or_create_account("SPAR")
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_unknown_name_is_searched_not_relisted(self):
+        """A miss on a fresh index searches by name instead of listing all accounts."""
+        self._add_accounts(["SPAR"])
+        responses.add(
+            responses.GET,
+            f"{self.BASE_URL}/api/v1/search/accounts",
+            json={
+                "data": [
+                    {"id": "7", "attributes": {"name": "Billa Plus", "type": "expense"}},
+                    {"id": "8", "attributes": {"name": "Billa", "type": "expense"}},
+                ],
+                "meta": {"pagination": {"total_pages": 1}},
+            },
+            status=200,
+        )
+
+        client = FireflyClient(self.BASE_URL, self.TOKEN)
+        client.find_or_create_account("SPAR")
+
+        assert client.find_or_create_account("billa") == 8
+        assert client.find_or_create_account("BILLA") == 8
+        assert [c.request.url.split("?")[0] for c in responses.calls] == [
+            f"{self.BASE_URL}/api/v1/accounts",
+            f"{self.BASE_URL}/api/v1/search/accounts",
+        ]
+        assert responses.calls[1].request.params["field"] == "name"
+
+    @responses.activate
+    def test_list_accounts_disk_cache(self, tmp_path):
+        """Account listings persist in cache_dir across client instances."""
+        self._add_accounts(["SPAR"])
+
+        first = FireflyClient(self.BASE_URL, self.TOKEN, cache_dir=tmp_path)
+        assert [a["name"] for a in first.list_accounts("expense")] == ["SPAR"]
+
+        second = FireflyClient(self.BASE_URL, self.TOKEN, cache_dir=tmp_path)
+        assert [a["name"] for a in second.list_accounts("expense")] == ["SPAR"]
+        assert len(responses.calls) == 1
+
+        # Another token gets its own cache entry
+        FireflyClient(self.BASE_URL, "other-token", cache_dir=tmp_path).list_accounts("expense")
+        assert len(responses.calls) == 2
+
+        second.invalidate_accounts_cache("expense")
+        second.list_accounts("expense")
+        assert len(responses.calls) == 3
+
+        # A truncated listing is cached separately from a full one
+        second.list_accounts("expense", max_pages=1)
+        assert len(responses.calls) == 4
+
+    @responses.activate
+    def test_account_index_ignores_disk_cache(self, tmp_path):
+        """Rebuilding the name index lists fresh, so stale listings can't cause duplicates."""
+        self._add_accounts(["SPAR"])
+        FireflyClient(self.BASE_URL, self.TOKEN, cache_dir=tmp_path).list_accounts("expense")
+
+        client = FireflyClient(self.BASE_URL, self.TOKEN, cache_dir=tmp_path)
+        assert client.find_or_create_account("SPAR") == 1
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_find_category_by_name_reuses_index(self):
+        """Category lookups share one listing until the TTL expires."""
+        responses.add(
+            responses.GET,
+            f"{self.BASE_URL}/api/v1/categories",
+            json={
+                "data": [{"id": "3", "attributes": {"name": "Groceries"}}],
+                "meta": {"pagination": {"total_pages": 1}},
+            },
+            status=200,
+        )
+
+        client = FireflyClient(self.BASE_URL, self.TOKEN)
+
+        assert client.find_category_by_name(" groceries ").id == 3
+        assert client.find_category_by_name("Groceries").id == 3
+        assert len(responses.calls) == 1
+
+
+class TestFireflyHttpxTransport:
+    """Test the httpx transport used for HTTP/2."""
+
+    BASE_URL = "http://firefly.test:8080"
+
+    def _client(self, handler) -> FireflyClient:
+        import httpx
+
+        from paperless_firefly.firefly_client.client import _HttpxTransport
+
+        client = FireflyClient(self.BASE_URL, "token")
+        client._transport = _HttpxTransport(
+            httpx.Client(transport=httpx.MockTransport(handler), headers={"Accept": "json"})
+        )
+        return client
+
+    def test_request_round_trip(self):
+        """Requests and responses go through httpx unchanged."""
+        import json
+
+        import httpx
+
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, json={"data": {"id": "7"}})
+
+        client = self._client(handler)
+
+        assert client.create_tag("groceries") == 7
+        assert seen[0].method == "POST"
+        assert json.loads(seen[0].content)["tag"] == "groceries"
+
+    def test_error_response_raises_api_error(self):
+        """Non-2xx httpx responses surface as FireflyAPIError."""
+        import httpx
+
+        from paperless_firefly.firefly_client import FireflyAPIError
+
+        def handler(request):
+            return httpx.Response(
+                422, json={"message": "Invalid", "errors": {"tag": ["Already exists"]}}
+            )
+
+        client = self._client(handler)
+
+        with pytest.raises(FireflyAPIError) as exc_info:
+            client.create_tag("groceries")
+        assert exc_info.value.status_code == 422
+        assert exc_info.value.errors == {"tag": ["Already exists"]}
+
+    def test_connect_error_raises_connection_error(self):
+        """httpx connection failures map to FireflyConnectionError."""
+        import httpx
+
+        from paperless_firefly.firefly_client.client import FireflyConnectionError
+
+        def handler(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        client = self._client(handler)
+
+        with pytest.raises(FireflyConnectionError):
+            client.get_about()
+
+
+class TestAsyncFireflyClient:
+    """Test the asyncio client for concurrent list fetches and imports."""
+
+    BASE_URL = "http://firefly.test:8080"
+
+    def _run(self, handler, call):
+        import asyncio
+
+        import httpx
+
+        from paperless_firefly.firefly_client import AsyncFireflyClient
+
+        async def main():
+            async with AsyncFireflyClient(
+                self.BASE_URL, "token", transport=httpx.MockTransport(handler)
+            ) as client:
+                return await call(client)
+
+        return asyncio.run(main())
+
+    def test_alist_categories_fetches_all_pages_in_order(self):
+        """Pages 2..N are gathered after page 1 and returned in page order."""
+        import httpx
+
+        pages_requested = []
+
+        def handler(request):
+            page = int(request.url.params["page"])
+            pages_requested.append(page)
+            return httpx.Response(
+                200,
+                json={
+                    "data": [{"id": str(page), "attributes": {"name": f"Category {page}"}}],
+                    "meta": {"pagination": {"total_pages": 3}},
+                },
+            )
+
+        categories = self._run(handler, lambda client: client.alist_categories())
+
+        assert [c.id for c in categories] == [1, 2, 3]
+        assert pages_requested[0] == 1
+        assert sorted(pages_requested) == [1, 2, 3]
+
+    def test_alist_transactions_matches_sync_parsing(self):
+        """Async listing aggregates splits like FireflyClient.list_transactions."""
+        import httpx
+
+        def handler(request):
+            return httpx.Response(
+                200,
+                json={
+                    "data": [
+                        {
+                            "id": "42",
+                            "attributes": {
+                                "transactions": [
+                                    {"type": "withdrawal", "date": "", "amount": "10.00"},
+                                    {"type": "withdrawal", "date": "", "amount": "1.48"},
+                                ]
+                            },
+                        }
+                    ],
+                    "meta": {"pagination": {"total_pages": 1}},
+                },
+            )
+
+        transactions = self._run(
+            handler, lambda client: client.alist_transactions("2024-11-01", "2024-11-30")
+        )
+
+        assert len(transactions) == 1
+        assert transactions[0].amount == "11.48"
+        assert transactions[0].split_count == 2
+
+    def test_error_response_raises_api_error(self):
+        """Error responses surface as FireflyAPIError."""
+        import httpx
+
+        from paperless_firefly.firefly_client import FireflyAPIError
+
+        def handler(request):
+            return httpx.Response(401, json={"message": "Unauthenticated."})
+
+        with pytest.raises(FireflyAPIError) as exc_info:
+            self._run(handler, lambda client: client.alist_accounts())
+        assert exc_info.value.status_code == 401
+        assert exc_info.value.message == "Unauthenticated."
+
+    def test_acreate_transactions_bulk(self):
+        """Bulk creates run concurrently, keep input order and skip known duplicates."""
+        import httpx
+
+        posted = []
+
+        def handler(request):
+            if request.url.path == "/api/v1/search/transactions":
+                if "existing" in request.url.params["query"]:
+                    return httpx.Response(
+                        200,
+                        json={
+                            "data": [
+                                {
+                                    "id": "5",
+                                    "attributes": {
+                                        "transactions": [{"external_id": "paperless:existing"}]
+                                    },
+                                }
+                            ]
+                        },
+                    )
+                return httpx.Response(200, json={"data": []})
+            posted.append(request)
+            return httpx.Response(200, json={"data": {"id": str(100 + len(posted))}})
+
+        def make_payload(external_id: str) -> FireflyTransactionStore:
+            return FireflyTransactionStore(
+                transactions=[
+                    FireflyTransactionSplit(
+                        type="withdrawal",
+                        date="2024-11-18",
+                        amount="11.48",
+                        description="SPAR Purchase",
+                        source_name="Checking Account",
+                        destination_name="SPAR",
+                        external_id=external_id,
+                        notes="paperless_document_id=1, source_hash=abc",
+                    )
+                ]
+            )
+
+        payloads = [make_payload("paperless:existing"), make_payload("paperless:new")]
+        results = self._run(handler, lambda client: client.acreate_transactions_bulk(payloads))
+
+        assert results == [5, 101]
+        assert len(posted) == 1
+
+
+class TestClientErrorHandling:
+    """Test error handling in clients."""
+
+    @responses.activate
+    def test_paperless_api_error(self):
+        """Test handling of API errors."""
+        from paperless_firefly.paperless_client.client import PaperlessAPIError
+
+        responses.add(
+            responses.GET,
+            "http://paperless.test:8000/api/documents/1/",
+            json={"detail": "Not found."},
+            status=404,
+        )
+
+        client = PaperlessClient("http://paperless.test:8000", "token")
+
+        with pytest.raises(PaperlessAPIError) as exc_info:
+            client.get_document(1)
+
+        assert exc_info.value.status_code == 404
+
+    @responses.activate
+    def test_firefly_validation_error(self):
+        """Test handling of validation errors from Firefly."""
+        from paperless_firefly.firefly_client.client import FireflyAPIError
+
+        # Mock find_by_external_id to return no existing transaction
+        responses.add(
+            responses.GET,
+            "http://firefly.test:8080/api/v1/search/transactions",
+            json={"data": [], "meta": {"pagination": {"total": 0}}},
+            status=200,
+        )
+
+        responses.add(
+            responses.POST,
+            "http://firefly.test:8080/api/v1/transactions",
+            json={
+                "message": "The given data was invalid.",
+                "errors": {
+                    "transactions.0.amount": ["Amount is required"],
+                    "transactions.0.date": ["Date format invalid"],
+                },
+            },
+            status=422,
+        )
+
+        client = FireflyClient("http://firefly.test:8080", "token")
+
+        tx = FireflyTransactionSplit(
+            type="withdrawal",
+            date="2024-11-18",
+            amount="10.00",
+            description="Test",
+            external_id="test:123",
+            notes="paperless_document_id=123",
+        )
+        payload = FireflyTransactionStore(transactions=[tx])
+
+        with pytest.raises(FireflyAPIError) as exc_info:
+            client.create_transaction(payload)
+
+        assert exc_info.value.status_code == 422
+        assert exc_info.value.errors["transactions.0.date"] == ["Date format invalid"]
+        assert "The given data was invalid." in exc_info.value.response_body
+        assert "transactions.0.date: Date format invalid" in str(exc_info.value)
+
+    @responses.activate
+    def test_firefly_transient_error_is_retried(self):
+        """Transient 503 responses are retried by the session adapter."""
+        responses.add(responses.GET, "http://firefly.test:8080/api/v1/about", json={}, status=503)
+        responses.add(
+            responses.GET,
+            "http://firefly.test:8080/api/v1/about",
+            json={"data": {"version": "6.0.0"}},
+            status=200,
+        )
+
+        client = FireflyClient("http://firefly.test:8080", "token", backoff_factor=0)
+
+        assert client.get_about() == {"version": "6.0.0"}
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_firefly_circuit_breaker_fails_fast(self):
+        """Repeated 5xx responses open the breaker; a probe after recovery closes it."""
+        from paperless_firefly.firefly_client.client import (
+            FireflyAPIError,
+            FireflyConnectionError,
+        )
+
+        url = "http://firefly.test:8080/api/v1/about"
+        responses.add(responses.GET, url, json={"message": "Server Error"}, status=500)
+        responses.add(responses.GET, url, json={"message": "Server Error"}, status=500)
+        responses.add(responses.GET, url, json={"data": {"version": "6.0.0"}}, status=200)
+
+        client = FireflyClient("http://firefly.test:8080", "token", breaker_threshold=2)
+
+        for _ in range(2):
+            with pytest.raises(FireflyAPIError):
+                client.get_about()
+        with pytest.raises(FireflyConnectionError, match="circuit open"):
+            client.get_about()
+        assert len(responses.calls) == 2
+
+        # After the recovery period one probe is sent and closes the breaker
+        client._breaker._opened_at -= client._breaker.recovery_seconds
+        assert client.get_about() == {"version": "6.0.0"}
+        assert client._breaker.state == "closed"
+
+    @responses.activate
+    def test_firefly_deadline_caps_and_stops_requests(self):
+        """Requests inside deadline() get the remaining time as timeout and fail once it is spent."""
+        from paperless_firefly.firefly_client.client import FireflyConnectionError
+
+        responses.add(
+            responses.GET,
+            "http://firefly.test:8080/api/v1/about",
+            json={"data": {"version": "6.0.0"}},
+            status=200,
+        )
+
+        client = FireflyClient("http://firefly.test:8080", "token", timeout=30)
+        timeouts = []
+        send = client._transport.send
+
+        def recording_send(method, url, params, body, timeout):
+            timeouts.append(timeout)
+            return send(method, url, params, body, timeout)
+
+        client._transport.send = recording_send
+
+        client.get_about()
+        with client.deadline(5):
+            client.get_about()
+        assert timeouts[0] == 30
+        assert 0 < timeouts[1] <= 5
+
+        with client.deadline(0):
+            with pytest.raises(FireflyConnectionError, match="Deadline exceeded"):
+                client.get_about()
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_firefly_html_error_body_is_capped(self):
+        """A large non-JSON error page is not parsed and is truncated on the error."""
+        from paperless_firefly.firefly_client.client import FireflyAPIError
+
+        responses.add(
+            responses.GET,
+            "http://firefly.test:8080/api/v1/about",
+            body="<html>" + "x" * 100_000 + "</html>",
+            status=500,
+        )
+
+        client = FireflyClient("http://firefly.test:8080", "token")
+
+        with pytest.raises(FireflyAPIError) as exc_info:
+            client.get_about()
+
+        assert exc_info.value.message == "Internal Server Error"
+        assert len(exc_info.value.response_body) == 4096
+        assert exc_info.value.response_body.startswith("<html>")
+
+    @responses.activate
+    def test_firefly_exhausted_retries_raise_api_error(self):
+        """Once retries are exhausted the last status is reported as an API error."""
+        from paperless_firefly.firefly_client.client import FireflyAPIError
+
+        responses.add(
+            responses.GET,
+            "http://firefly.test:8080/api/v1/about",
+            json={"message": "Service Unavailable"},
+            status=503,
+        )
+
+        client = FireflyClient("http://firefly.test:8080", "token", max_retries=2, backoff_factor=0)
+
+        with pytest.raises(FireflyAPIError) as exc_info:
+            client.get_about()
+
+        assert exc_info.value.status_code == 503
+        assert len(responses.calls) == 3
 
 
 class TestNormalizeTags:
@@ -212,6 +212,25 @@ class TestValidateFireflyPayload:
         assert len(errors) > 0
         assert any("empty" in e for e in errors)
 
+    def test_invalid_split_amount_is_reported(self):
+        """An unparseable amount in a multi-split payload is an error, not an exception."""
+        splits = [
+            FireflyTransactionSplit(
+                type="withdrawal",
+                date="2024-01-01",
+                amount=amount,
+                description="Test",
+                external_id="test:123",
+                notes="Test notes",
+            )
+            for amount in ("10.00", "ten")
+        ]
+        payload = FireflyTransactionStore(transactions=splits)
+
+        errors = validate_firefly_payload(payload)
+
+        assert any("valid decimal" in e for e in errors)
+
     def test_missing_type(self):
         """Missing type is invalid."""
         split = FireflyTransactionSplit(
@@ -25,6 +25,13 @@ class TestMatchScore:
         score = MatchScore(signal="test", score=1.0, weight=0.0, detail="test")
         assert score.weighted_score == 0.0
 
+    def test_uses_slots(self) -> None:
+        """Test match objects carry no per-instance __dict__."""
+        score = MatchScore(signal="test", score=1.0, weight=0.0, detail="test")
+        result = MatchResult(firefly_id=1, document_id=2, total_score=0.5, signals=[score])
+        assert not hasattr(score, "__dict__")
+        assert not hasattr(result, "__dict__")
+
 
 class TestMatchResult:
     """Tests for MatchResult dataclass."""
@@ -116,6 +123,16 @@ class TestMatchingEngine:
         assert score.score == 0.0
         assert "missing" in score.detail
 
+    def test_score_amount_compares_rounded_units(self, engine: MatchingEngine) -> None:
+        """Test amounts are compared at 4 decimal places, ignoring trailing precision."""
+        score = engine._score_amount(Decimal("99.990000000000"), Decimal("99.99"))
+        assert score.score == 1.0
+        assert engine._score_amount(Decimal("100.00"), Decimal("101.00")).score == 0.95
+        assert engine._score_amount(Decimal("100.00"), Decimal("0")).detail == (
+            "mismatch: 100.00 vs 0"
+        )
+        assert engine._score_amount(Decimal("NaN"), Decimal("1.00")).detail == "missing"
+
     # Date scoring tests
 
     def test_score_date_same_day(self, engine: MatchingEngine) -> None:
@@ -245,6 +262,16 @@ class TestMatchingEngine:
         """Test parsing None returns None."""
         assert engine._parse_date(None) is None
 
+    def test_parse_date_fallback_formats(self, engine: MatchingEngine) -> None:
+        """Test non-ISO dates fall back to the day-first and month-first formats."""
+        assert engine._parse_date("15/01/2025") == datetime(2025, 1, 15)
+        assert engine._parse_date("01/31/2025") == datetime(2025, 1, 31)
+        assert engine._parse_date("2025-1-5") == datetime(2025, 1, 5)
+
+    def test_parse_date_invalid_iso(self, engine: MatchingEngine) -> None:
+        """Test an ISO-shaped but impossible date returns None."""
+        assert engine._parse_date("2025-02-30") is None
+
     # Integration tests
 
     def test_find_matches_no_cached_transactions(
@@ -409,3 +436,212 @@ class TestMatchingEngine:
         results = engine.find_matches(document_id=1, extraction=extraction, max_results=3)
 
         assert len(results) <= 3
+
+    def test_find_matches_builds_signal_breakdown(
+        self, engine: MatchingEngine, store: StateStore
+    ) -> None:
+        """Test returned matches carry the same breakdown as the _score_* methods."""
+        store.upsert_document(document_id=1, source_hash="hash1", title="Test")
+        store.upsert_firefly_cache(
+            firefly_id=100,
+            type_="withdrawal",
+            date="2025-01-17",
+            amount="100.50",
+            description="Amazon Order",
+            destination_account="Amazon EU",
+        )
+
+        extraction = {
+            "amount": "100.00",
+            "date": "2025-01-15",
+            "vendor": "Amazon",
+            "description": "amazon order",
+        }
+        results = engine.find_matches(document_id=1, extraction=extraction)
+
+        assert len(results) == 1
+        expected = [
+            engine._score_amount(Decimal("100.00"), Decimal("100.50")),
+            engine._score_date(datetime(2025, 1, 15), datetime(2025, 1, 17)),
+            engine._score_description("amazon order", "Amazon Order"),
+            engine._score_vendor("Amazon", "Amazon EU"),
+        ]
+        assert results[0].signals == expected
+        assert results[0].total_score == pytest.approx(sum(s.weighted_score for s in expected))
+        assert results[0].reasons == [
+            "amount_match (~1%: 100.00 vs 100.50)",
+            "date_close (2 days)",
+            "description_match (exact)",
+            "vendor_match (contains)",
+        ]
+        assert results[0].is_exact_match is False
+
+    def test_find_matches_boosts_exact_match(
+        self, engine: MatchingEngine, store: StateStore
+    ) -> None:
+        """Test amount+date+account exact matches are boosted above weak text signals."""
+        store.upsert_document(document_id=1, source_hash="hash1", title="Test")
+        store.upsert_firefly_cache(
+            firefly_id=100,
+            type_="withdrawal",
+            date="2025-01-15",
+            amount="42.00",
+            description="Card payment 8812",
+            source_account="Checking",
+            destination_account="Bakery",
+        )
+
+        extraction = {
+            "amount": "42.00",
+            "date": "2025-01-15",
+            "vendor": "Unknown",
+            "source_account": "checking",
+        }
+        results = engine.find_matches(document_id=1, extraction=extraction)
+
+        assert [r.firefly_id for r in results] == [100]
+        assert results[0].is_exact_match is True
+        assert results[0].total_score == 0.99
+        assert results[0].reasons[-1] == "EXACT_MATCH (amount+date+account)"
+
+    def test_find_matches_reuses_parsed_candidates(
+        self, engine: MatchingEngine, store: StateStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test cached transactions are only re-parsed when their row changes."""
+        store.upsert_document(document_id=1, source_hash="hash1", title="Test")
+        for i in range(3):
+            store.upsert_firefly_cache(
+                firefly_id=100 + i,
+                type_="withdrawal",
+                date="2025-01-15",
+                amount=f"{10 + i}.00",
+                description="Amazon Order",
+                destination_account="Amazon",
+            )
+
+        parse_amount = MagicMock(wraps=engine._parse_amount)
+        monkeypatch.setattr(engine, "_parse_amount", parse_amount)
+        extraction = {"amount": "11.00", "date": "2025-01-15", "vendor": "Amazon"}
+
+        engine.find_matches(document_id=1, extraction=extraction)
+        assert parse_amount.call_count == 4  # 3 candidates + the extraction
+
+        parse_amount.reset_mock()
+        engine.find_matches(document_id=1, extraction=extraction)
+        assert parse_amount.call_count == 1
+
+        store.upsert_firefly_cache(
+            firefly_id=101,
+            type_="withdrawal",
+            date="2025-01-15",
+            amount="12.50",
+            description="Amazon Order",
+            destination_account="Amazon",
+        )
+        parse_amount.reset_mock()
+        results = engine.find_matches(document_id=1, extraction=extraction)
+        assert parse_amount.call_count == 2
+        updated = next(r for r in results if r.firefly_id == 101)
+        assert updated.signals[0].detail == "~20%: 11.00 vs 12.50"
+
+    def test_find_matches_skips_text_scoring_for_hopeless_candidates(
+        self, engine: MatchingEngine, store: StateStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test candidates that cannot reach the top results are not text-scored."""
+        from paperless_firefly.matching import engine as engine_module
+
+        store.upsert_document(document_id=1, source_hash="hash1", title="Test")
+        for i in range(3):
+            store.upsert_firefly_cache(
+                firefly_id=100 + i,
+                type_="withdrawal",
+                date="2025-01-15",
+                amount="99.99",
+                description="Amazon Order",
+                destination_account="Amazon",
+            )
+        store.upsert_firefly_cache(
+            firefly_id=200,
+            type_="withdrawal",
+            date="2024-03-01",
+            amount="5.00",
+            description="Amazon Order",
+            destination_account="Amazon Marketplace",
+        )
+
+        calls: list[str | None] = []
+        original = engine_module._vendor_score
+
+        def counting_vendor_score(extracted: str | None, transaction: str | None):
+            calls.append(transaction)
+            return original(extracted, transaction)
+
+        monkeypatch.setattr(engine_module, "_vendor_score", counting_vendor_score)
+        extraction = {
+            "amount": "99.99",
+            "date": "2025-01-15",
+            "vendor": "Amazon",
+            "description": "Amazon Order",
+        }
+        results = engine.find_matches(document_id=1, extraction=extraction, max_results=2)
+
+        assert [r.firefly_id for r in results] == [100, 101]
+        # Two results score ~1.0, so the 5.00 transaction (at most 0.35) is skipped
+        assert "amazon marketplace" not in calls
+
+    def test_find_matches_batch_loads_cache_once(
+        self, engine: MatchingEngine, store: StateStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a batch reads the unmatched transactions once and matches each job."""
+        store.upsert_firefly_cache(
+            firefly_id=100,
+            type_="withdrawal",
+            date="2025-01-15",
+            amount="99.99",
+            description="Amazon Order",
+            destination_account="Amazon",
+        )
+        store.upsert_firefly_cache(
+            firefly_id=101,
+            type_="withdrawal",
+            date="2025-02-03",
+            amount="12.40",
+            description="Coffee",
+            destination_account="Cafe Central",
+        )
+        load = MagicMock(wraps=store.get_unmatched_firefly_transactions)
+        monkeypatch.setattr(store, "get_unmatched_firefly_transactions", load)
+
+        jobs = [
+            (1, {"amount": "99.99", "date": "2025-01-15", "vendor": "Amazon"}),
+            (2, {"amount": "12.40", "date": "2025-02-03", "vendor": "Cafe Central"}),
+        ]
+        batch = engine.find_matches_batch(jobs, max_results=1)
+
+        assert load.call_count == 1
+        assert [[r.firefly_id for r in results] for results in batch] == [[100], [101]]
+        assert [results[0].document_id for results in batch] == [1, 2]
+        assert batch[0][0].to_dict() == engine.find_matches(*jobs[0], max_results=1)[0].to_dict()
+
+    def test_engines_share_parsed_candidates(
+        self, store: StateStore, mock_config: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a new engine on the same database reuses the rows parsed by another."""
+        store.upsert_firefly_cache(
+            firefly_id=100,
+            type_="withdrawal",
+            date="2025-01-15",
+            amount="99.99",
+            description="Amazon Order",
+            destination_account="Amazon",
+        )
+        extraction = {"amount": "99.99", "date": "2025-01-15", "vendor": "Amazon"}
+        MatchingEngine(state_store=store, config=mock_config).find_matches(1, extraction)
+
+        second = MatchingEngine(state_store=store, config=mock_config)
+        parse_amount = MagicMock(wraps=second._parse_amount)
+        monkeypatch.setattr(second, "_parse_amount", parse_amount)
+        results = second.find_matches(1, extraction)
+
+        assert [r.firefly_id for r in results] == [100]
+        assert parse_amount.call_count == 1  # only the extraction
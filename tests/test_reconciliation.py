@@ -353,6 +353,51 @@ class TestProposalCreation:
         exists = reconciliation_service._proposal_exists(200, test_document)
         assert exists is False
 
+    def test_repeated_document_rows_propose_once(
+        self,
+        reconciliation_service: ReconciliationService,
+        state_store,
+        test_document,
+    ) -> None:
+        """Later extractions of an already-proposed document are skipped."""
+        state_store.upsert_firefly_cache(
+            firefly_id=100,
+            type_="withdrawal",
+            date="2024-01-01",
+            amount="100.00",
+            description="Grocery Store",
+        )
+        state_store.upsert_firefly_cache(
+            firefly_id=200,
+            type_="withdrawal",
+            date="2024-06-01",
+            amount="250.00",
+            description="Hardware Shop",
+        )
+        # A re-extraction of the same document that would match another transaction
+        for external_id, amount, date in [
+            ("plf-1-20240101-100.00-abc", "100.00", "2024-01-01"),
+            ("plf-1-20240601-250.00-def", "250.00", "2024-06-01"),
+        ]:
+            extraction_id = state_store.save_extraction(
+                document_id=test_document,
+                external_id=external_id,
+                extraction_json=json.dumps({"total_gross": amount, "date": date}),
+                overall_confidence=0.95,
+                review_state="APPROVED",
+            )
+            state_store.update_extraction_review(extraction_id, "APPROVED")
+        result = ReconciliationResult(state=ReconciliationState.MATCHING)
+
+        with patch.object(reconciliation_service, "_get_existing_link", return_value=None):
+            reconciliation_service._process_unmatched_transactions(result, dry_run=False)
+
+        with state_store._transaction() as conn:
+            rows = conn.execute("SELECT firefly_id FROM match_proposals").fetchall()
+        assert [row["firefly_id"] for row in rows] == [100]
+        assert result.proposals_created == 1
+        assert result.proposals_existing == 1
+
 
 class TestAutoLinking:
     """Tests for auto-linking high-confidence matches."""
@@ -704,3 +704,59 @@ class TestFireflyCacheSoftDelete:
         # Timestamp unchanged
         entry = store.get_firefly_cache_entry(123)
         assert entry["deleted_at"] == first_deleted_at
+
+
+class TestMatchProposalBatches:
+    """Tests for the batched match proposal writes."""
+
+    @pytest.fixture
+    def store(self, temp_db):
+        store = StateStore(temp_db)
+        store.upsert_document(document_id=1, source_hash="hash1", title="Test")
+        for firefly_id in (100, 101):
+            store.upsert_firefly_cache(
+                firefly_id=firefly_id,
+                type_="withdrawal",
+                date="2024-01-15",
+                amount="50.00",
+                description="Test transaction",
+            )
+        return store
+
+    def test_create_match_proposals_returns_ids_in_order(self, store):
+        """Test proposals are created with their status and reasons."""
+        ids = store.create_match_proposals(
+            [
+                {
+                    "firefly_id": 100,
+                    "document_id": 1,
+                    "match_score": 0.95,
+                    "status": "AUTO_MATCHED",
+                },
+                {"firefly_id": 101, "document_id": 1, "match_score": 0.4, "match_reasons": ["x"]},
+            ]
+        )
+
+        assert len(ids) == 2
+        first, second = (store.get_proposal_by_id(proposal_id) for proposal_id in ids)
+        assert first["firefly_id"] == 100
+        assert first["status"] == "AUTO_MATCHED"
+        assert first["reviewed_at"] is not None
+        assert second["status"] == "PENDING"
+        assert second["reviewed_at"] is None
+        assert second["match_reasons"] == '["x"]'
+
+    def test_update_firefly_match_statuses(self, store):
+        """Test several cache entries are updated at once."""
+        store.update_firefly_match_statuses(
+            [
+                {"firefly_id": 100, "status": "MATCHED", "document_id": 1, "confidence": 0.9},
+                {"firefly_id": 101, "status": "REJECTED"},
+            ]
+        )
+
+        matched = store.get_firefly_cache_entry(100)
+        assert matched["match_status"] == "MATCHED"
+        assert matched["matched_document_id"] == 1
+        assert matched["match_confidence"] == 0.9
+        assert store.get_firefly_cache_entry(101)["match_status"] == "REJECTED"
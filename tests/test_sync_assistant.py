@@ -280,6 +280,7 @@ class TestFireflyClientExtensions:
             ],
             "meta": {"pagination": {"total_pages": 1}},
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
 
         client = FireflyClient("http://test", "token")
         monkeypatch.setattr(client, "_request", lambda *a, **kw: mock_response)
@@ -312,6 +313,7 @@ class TestFireflyClientExtensions:
             ],
             "meta": {"pagination": {"total_pages": 1}},
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
 
         client = FireflyClient("http://test", "token")
         monkeypatch.setattr(client, "_request", lambda *a, **kw: mock_response)
@@ -331,6 +333,7 @@ class TestFireflyClientExtensions:
 
         mock_response = MagicMock()
         mock_response.json.return_value = {"data": {"id": 42}}
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
 
         client = FireflyClient("http://test", "token")
         
@@ -378,6 +381,36 @@ class TestFireflyClientExtensions:
 
         assert tag is None
 
+    def test_create_many_preserves_order_and_errors(self, monkeypatch):
+        """create_many returns IDs in input order and captures per-item errors."""
+        from paperless_firefly.firefly_client.client import FireflyClient
+
+        client = FireflyClient("http://test", "token")
+
+        def fake_create_budget(name, **kwargs):
+            if name == "bad":
+                raise ValueError("rejected")
+            return {"Food": 1, "Rent": 2}[name]
+
+        monkeypatch.setattr(client, "create_budget", fake_create_budget)
+
+        results = client.create_many(
+            "budget", [{"name": "Food"}, {"name": "bad"}, {"name": "Rent"}]
+        )
+
+        assert results[0] == 1
+        assert isinstance(results[1], ValueError)
+        assert results[2] == 2
+
+    def test_create_many_rejects_unknown_kind(self):
+        """create_many raises for unsupported entity kinds."""
+        from paperless_firefly.firefly_client.client import FireflyClient
+
+        client = FireflyClient("http://test", "token")
+
+        with pytest.raises(ValueError, match="Unsupported kind"):
+            client.create_many("account", [{"name": "x"}])
+
 
 class TestNewEntityFingerprints:
     """Tests for fingerprint computation of newly added entity types."""